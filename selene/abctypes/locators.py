@@ -26,6 +26,7 @@ from future.utils import with_metaclass
 
 
 class ISeleneWebElementLocator(with_metaclass(ABCMeta, object)):
+    __slots__ = ()
 
     @abstractmethod
     def find(self):
@@ -37,11 +38,21 @@ class ISeleneWebElementLocator(with_metaclass(ABCMeta, object)):
         # type: () -> str
         pass
 
+    def page_query(self):
+        # type: () -> PageQuery
+        """returns None if the locator can't be resolved in the page"""
+        return None
+
+    def forget_stale(self):
+        """drops webelements kept by the locator (or by its parents), called when found element is stale"""
+        pass
+
     def __str__(self):
         return self.description
 
 
 class ISeleneListWebElementLocator(with_metaclass(ABCMeta, object)):
+    __slots__ = ()
 
     @abstractmethod
     def find(self):
@@ -53,6 +64,15 @@ class ISeleneListWebElementLocator(with_metaclass(ABCMeta, object)):
         # type: () -> str
         pass
 
+    def page_query(self):
+        # type: () -> PageQuery
+        """returns None if the locator can't be resolved in the page"""
+        return None
+
+    def forget_stale(self):
+        """drops webelements kept by the locator (or by its parents), called when found element is stale"""
+        pass
+
     def __str__(self):
         return self.description
 
@@ -30,6 +30,7 @@ from selenium.webdriver.remote.webelement import WebElement
 
 
 class ISearchContext(with_metaclass(ABCMeta, object)):
+    __slots__ = ()
 
     @abstractmethod
     def find_element(self, by=By.ID, value=None):
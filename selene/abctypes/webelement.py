@@ -29,6 +29,7 @@ from selene.abctypes.search_context import ISearchContext
 
 
 class IWebElement(ISearchContext):
+    __slots__ = ()
 
     @abstractproperty
     def __repr__(self): pass
@@ -0,0 +1,179 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Opt-in batching of element actions: inside `with batch():` actions (click, set, clear) of elements,
+that can be resolved in the page, are recorded and performed in the page by one execute_script call
+right before the next command of selene elements, collections or driver (like execute_script or title),
+or at the end of the block.
+"""
+import contextlib
+import itertools
+import threading
+
+from selene.page_query import PageQuery
+
+# performs the actions (args[0]) on elements of chains one by one, checking their preconditions first,
+# returns [number of performed actions, reason of the failure of the next one or null]
+_PERFORM = r'''
+for (var i = 0; i < chains.length; i++) {
+    var action = args[0][i];
+    var nodes = seleneResolve(chains[i][0], chains[i][1], chains[i][0].length);
+    var element = nodes === null ? null : nodes[0];
+    if (!element) {
+        return [i, 'element was not found'];
+    }
+    if (!seleneIsDisplayed(element)) {
+        return [i, 'element is not visible'];
+    }
+    if (action[0] !== 'click' && (!seleneIsEnabled(element) || element.readOnly)) {
+        return [i, 'element is not editable'];
+    }
+    try {
+        if (action[0] === 'click') {
+            element.click();
+        } else {
+            seleneSetValue(element, action[0] === 'set' ? action[1] : '');
+        }
+    } catch (error) {
+        return [i, String(error)];
+    }
+}
+return [chains.length, null];
+'''
+
+class _State(threading.local):
+    # the active batch is per thread, so actions of other threads (e.g. of pagination prefetch) are not recorded
+    batch = None  # type: Optional[Batch]
+    flushing = False
+
+
+_state = _State()
+
+
+class BatchStep(object):
+    """
+    Recorded action and the result of its execution: in_page is True if it was performed in the page,
+    otherwise it was performed as usual and error is the reason it was not performed in the page
+    """
+    __slots__ = ('element', 'action', 'value', 'query', 'in_page', 'error')
+
+    def __init__(self, element, action, value, query):
+        self.element = element
+        self.action = action
+        self.value = value
+        self.query = query
+        self.in_page = False
+        self.error = None
+
+    def __str__(self):
+        return '{action}({value}) on {element}'.format(
+            action=self.action, value='' if self.value is None else repr(self.value), element=self.element)
+
+    def perform(self):
+        if self.action == 'set':
+            self.element.set(self.value)
+        else:
+            getattr(self.element, self.action)()
+
+
+class Batch(object):
+    __slots__ = ('steps', '_pending')
+
+    def __init__(self):
+        self.steps = []  # type: List[BatchStep]
+        self._pending = []  # type: List[BatchStep]
+
+    def record(self, element, action, value, query):
+        step = BatchStep(element, action, value, query)
+        self.steps.append(step)
+        self._pending.append(step)
+
+    def perform_pending(self):
+        """
+        performs pending steps in the page, by one execute_script call per webdriver and frame,
+        and in case of failure performs the failed step and all following steps as usual
+        """
+        pending, self._pending = self._pending, []
+        groups = [list(group) for key, group in itertools.groupby(
+            pending, lambda step: (id(step.element._webdriver), step.query.frame))]
+        for number, group in enumerate(groups):
+            performed, error = PageQuery.execute_all(
+                group[0].element._webdriver, [step.query for step in group], _PERFORM,
+                [[step.action, step.value] for step in group])
+            for step in group[:performed]:
+                step.in_page = True
+            if error is not None:
+                group[performed].error = error
+                for step in group[performed:] + [step for later in groups[number + 1:] for step in later]:
+                    step.perform()
+                return
+
+
+def recorded(element, action, value=None):
+    # type: (SeleneElement, str, object) -> bool
+    """
+    records the action of the element if the batch is active and the element can be resolved in the page,
+    otherwise performs the recorded actions, so the action can be performed as usual after them
+    """
+    if _state.batch is None or _state.flushing:
+        return False
+    query = element._locator.page_query()
+    if query is None:
+        flush()
+        return False
+    _state.batch.record(element, action, value, query)
+    return True
+
+
+def flush():
+    """
+    performs actions recorded in the active batch
+    """
+    if _state.batch is None or _state.flushing:
+        return
+    _state.flushing = True
+    try:
+        _state.batch.perform_pending()
+    finally:
+        _state.flushing = False
+
+
+@contextlib.contextmanager
+def batch():
+    """
+    Inside the block, actions of elements are recorded and performed in the page together (see the module docs).
+    Yields the Batch, which steps are the recorded actions with their results.
+    Actions are performed by javascript (element.click() and setting value with input and change events),
+    after checking in the page that the element is visible (and enabled and not readonly for set and clear).
+    Nested blocks share the outer one. Actions recorded before an exception raised in the block are not performed.
+    """
+    if _state.batch is not None:
+        yield _state.batch
+        return
+    _state.batch = Batch()
+    try:
+        yield _state.batch
+        flush()
+    finally:
+        _state.batch = None
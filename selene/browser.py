@@ -24,9 +24,12 @@ import os
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+import selene.batching
 import selene.config
 import selene.driver
 import selene.factory
+import selene.frames
+import selene.resolution
 from selene import helpers
 from selene.common.none_object import NoneObject
 from selene.elements import SeleneElement, SeleneCollection
@@ -74,7 +77,9 @@ def open_url(absolute_or_relative_url):
     """
     # todo: refactor next line when app_host is removed
     base_url = selene.config.app_host if selene.config.app_host else selene.config.base_url
+    selene.batching.flush()
     driver().get(base_url + absolute_or_relative_url)
+    selene.frames.reset(driver())
 
 
 def element(css_selector_or_by):
@@ -88,6 +93,17 @@ def all(css_selector_or_by):
     return elements(css_selector_or_by)
 
 
+def frame(css_selector_or_by):
+    """
+    Returns the context of elements inside the frame, which is switched to automatically when they are found
+
+    :Usage:
+        browser.frame('#editor').element('body').set_value('Hello')
+        browser.element('#save').click()
+    """
+    return selene.driver._shared_driver.frame(css_selector_or_by)
+
+
 _latest_screenshot = NoneObject("selene.browser._latest_screenshot")
 
 
@@ -118,6 +134,7 @@ def wait_to(webdriver_condition, timeout=None, polling=None):
     if polling is None:
         polling = selene.config.poll_during_waits
 
+    selene.batching.flush()
     return wait_for(driver(), webdriver_condition, timeout, polling)
 
 
@@ -125,9 +142,39 @@ def should(webdriver_condition, timeout=None, polling=None):
     return wait_to(webdriver_condition, timeout, polling)
 
 
+def resolution_scope():
+    """
+    Opens the scope, where parents of inner elements are found only once per scope
+    (and are found again only when become stale)
+
+    :Usage:
+        with browser.resolution_scope():
+            row.element('.name').should(have.text('Bob'))
+            row.element('.price').should(have.text('$10'))
+    """
+    return selene.resolution.resolution_scope()
+
+
+def batch():
+    """
+    Opens the block, where actions (click, set, clear) of elements, that can be resolved in the page,
+    are performed by one execute_script call, see selene.batching
+
+    :Usage:
+        with browser.batch() as steps:
+            browser.element('#name').set('Bob')
+            browser.element('#email').set('bob@example.com')
+            browser.element('#agree').click()
+        assert all(step.in_page for step in steps.steps)
+    """
+    return selene.batching.batch()
+
+
 def execute_script(script, *args):
+    selene.batching.flush()
     return driver().execute_script(script, *args)
 
 
 def title():
+    selene.batching.flush()
     return driver().title
@@ -20,8 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
+
 from selenium.webdriver.common.by import By
 
+from selene.helpers import css_or_by_to_by
+from selene.page_query import RELATIVE, SHADOW, compiled_by
+
 __author__ = 'yashaka'
 
 
@@ -80,6 +85,53 @@ def by_partial_text(element_text):
 with_text = by_partial_text
 
 
+def by_shadow(path):
+    """
+    locator of elements found by css selectors path like 'my-app >>> my-input >>> input',
+    where each next selector after >>> is searched inside open shadow roots of elements found by the previous one,
+    the path starting with >>> (like '>>> input') is searched inside the shadow root of the parent element,
+    the elements are found in the page by one execute_script call
+    """
+    return (SHADOW, path)
+
+
+def by_relative(direction, anchor, selector, distance=None):
+    """
+    locator of elements found by selector, placed in direction (above, below, left_of, right_of or near)
+    relative to the element found by anchor, sorted by distance to the anchor;
+    both anchor and selector are css/xpath selectors or bys, searched in the same context,
+    the elements are found in the page by one execute_script call
+    """
+    anchor_by, candidates_by = compiled_by(css_or_by_to_by(anchor)), compiled_by(css_or_by_to_by(selector))
+    if anchor_by is None or candidates_by is None:
+        raise ValueError('relative locator supports only css selectors and xpath, but got: {}, {}'.format(
+            anchor, selector))
+    spec = {'direction': direction, 'anchor': list(anchor_by), 'candidates': list(candidates_by)}
+    if distance is not None:
+        spec['distance'] = distance
+    return (RELATIVE, json.dumps(spec, sort_keys=True))
+
+
+def above(anchor, selector='*'):
+    return by_relative('above', anchor, selector)
+
+
+def below(anchor, selector='*'):
+    return by_relative('below', anchor, selector)
+
+
+def left_of(anchor, selector='*'):
+    return by_relative('left_of', anchor, selector)
+
+
+def right_of(anchor, selector='*'):
+    return by_relative('right_of', anchor, selector)
+
+
+def near(anchor, selector='*', distance=50):
+    return by_relative('near', anchor, selector, distance)
+
+
 def escape_text_quotes_for_xpath(text):
     return 'concat("", "%s")' % (
         str(
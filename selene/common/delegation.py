@@ -20,35 +20,85 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import inspect
 from abc import ABCMeta
 
 
-def _make_delegator_method(name):
-    def delegator(self, *args, **kwargs):
-        return getattr(self.__delegate__, name)(*args, **kwargs)  # pragma: no cover
-        # todo: consider using __call__() instead of __delegate__
-        # in Python delegates are objects with __call__ method..
-        # so why not to use the following:
-        #     return getattr(self(), name)(*args, **kwargs)
-        # ?
-
+def _signature_of(function):
+    """
+    returns (parameters, arguments) source of the function signature without self,
+    e.g. ('self, name, *values', 'name, *values'), or None if the signature is not available
+    """
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):
+        return None
+    parameters, arguments = [], []
+    keyword_only_started = False
+    for parameter in list(signature.parameters.values())[1:]:
+        if parameter.kind == parameter.POSITIONAL_OR_KEYWORD:
+            parameters.append(parameter.name)
+            arguments.append(parameter.name)
+        elif parameter.kind == parameter.VAR_POSITIONAL:
+            parameters.append('*' + parameter.name)
+            arguments.append('*' + parameter.name)
+            keyword_only_started = True
+        elif parameter.kind == parameter.KEYWORD_ONLY:
+            if not keyword_only_started:
+                parameters.append('*')
+                keyword_only_started = True
+            parameters.append(parameter.name)
+            arguments.append('{name}={name}'.format(name=parameter.name))
+        elif parameter.kind == parameter.VAR_KEYWORD:
+            parameters.append('**' + parameter.name)
+            arguments.append('**' + parameter.name)
+        else:
+            return None
+    return ', '.join(['self'] + parameters), ', '.join(arguments)
+
+
+def _compiled(source, name):
+    namespace = {}
+    exec(compile(source, '<delegator {}>'.format(name), 'exec'), namespace)
+    return namespace[name]
+
+
+def _make_delegator_method(name, abstract_method=None):
+    """
+    generates the method calling the same method of self.__delegate__ with the same signature as abstract_method,
+    so no getattr by name and no repacking of *args, **kwargs happens on each call
+    """
+    signature = _signature_of(abstract_method) if abstract_method else None
+    parameters, arguments = signature or ('self, *args, **kwargs', '*args, **kwargs')
+    delegator = _compiled(
+        'def {name}({parameters}):\n'
+        '    return self.__delegate__.{name}({arguments})\n'.format(
+            name=name, parameters=parameters, arguments=arguments),
+        name)
+    if signature:
+        delegator.__defaults__ = abstract_method.__defaults__
+        delegator.__kwdefaults__ = abstract_method.__kwdefaults__
     return delegator
 
 
-# def _make_delegator_method_to_property(name):
-#     def delegator(self, *args, **kwargs):
-#         return getattr(self.__delegate__, name)
-#     return delegator
-
-
 def _make_delegator_property(name):
-    return property(lambda self: getattr(self.__delegate__, name))  # pragma: no cover
+    return property(_compiled(
+        'def {name}(self):\n'
+        '    return self.__delegate__.{name}\n'.format(name=name),
+        name))
 
 
 def _is_property(name, cls):
     return isinstance(getattr(cls, name, None), property)
 
 
+def _abstract_method_of(bases, name):
+    for base in bases:
+        if name in base.__abstractmethods__:
+            return getattr(base, name, None)
+    return None
+
+
 class DelegatingMeta(ABCMeta):
     def __new__(mcs, name, bases, dct):
         abstract_property_names = frozenset.union(
@@ -61,19 +111,15 @@ class DelegatingMeta(ABCMeta):
         abstract_method_names = frozenset.union(*(base.__abstractmethods__
                                                   for base in bases))
 
-        for name in abstract_method_names:
-            if name not in dct:
-                dct[name] = _make_delegator_method(name)
-
-        # for name in abstract_property_names:
-        #     if name not in dct:
-        #         dct[name] = _make_delegator_method_to_property(name)
+        for method_name in abstract_method_names:
+            if method_name not in dct:
+                dct[method_name] = _make_delegator_method(method_name, _abstract_method_of(bases, method_name))
 
         cls = super(DelegatingMeta, mcs).__new__(mcs, name, bases, dct)
 
-        for name in abstract_property_names:
-            if name not in dct:
-                setattr(cls, name, _make_delegator_property(name))
+        for property_name in abstract_property_names:
+            if property_name not in dct:
+                setattr(cls, property_name, _make_delegator_property(property_name))
 
         return cls
 
@@ -22,9 +22,11 @@
 
 from abc import ABCMeta, abstractmethod
 
+import json
 import operator
 from future.utils import with_metaclass, lmap
 
+from selene import text_strategies
 from selene.abctypes.conditions import IEntityCondition
 from selene.abctypes.webdriver import IWebDriver
 from selene.abctypes.webelement import IWebElement
@@ -57,6 +59,25 @@ class Not(IEntityCondition):
             return entity
         raise ConditionMismatchException()  # todo: add more information to message
 
+    @property
+    def in_page_actual(self):
+        return in_page_actual_of(self._condition)
+
+    def match(self, webelement):
+        try:
+            self._condition.match(webelement)
+        except Exception as reason:
+            return webelement
+        raise ConditionMismatchException()
+
+    def match_actual(self, actual):
+        match_actual = self._condition.match_actual  # not inverted: fails for conditions not checkable in the page
+        try:
+            match_actual(actual)
+        except Exception as reason:
+            return actual
+        raise ConditionMismatchException()
+
 
 
 not_ = Not
@@ -156,6 +177,11 @@ url_containing = UrlContaining
 
 
 class ElementCondition(with_metaclass(ABCMeta, IEntityCondition)):
+    # conditions that can be checked in the page define both
+    # in_page_actual - body of js function(element) returning the actual value, and
+    # match_actual(actual) - matching the returned value like match(webelement) does (see in_page_actual_of)
+    in_page_actual = None
+
     def description(self):
         return self.__class__.__name__
 
@@ -178,25 +204,55 @@ def is_matched(condition, webelement):
         return False
 
 
+def in_page_actual_of(condition):
+    # type: (IEntityCondition) -> Optional[str]
+    """
+    Returns the in_page_actual js of the condition, or None if the condition can't be checked in the page
+    """
+    in_page_actual = getattr(condition, 'in_page_actual', None)
+    return in_page_actual if in_page_actual and hasattr(condition, 'match_actual') else None
+
+
+def is_matched_actual(condition, actual):
+    # type: (ElementCondition, object) -> bool
+    try:
+        condition.match_actual(actual)
+        return True
+    except Exception:
+        return False
+
+
 class Visible(ElementCondition):
+    in_page_actual = 'return seleneIsDisplayed(element);'
+
     def match(self, webelement):
         # type: (SeleneElement) -> IWebElement
-        if not webelement.is_displayed():
-            raise ConditionMismatchException()
+        self.match_actual(webelement.is_displayed())
         return webelement
 
+    def match_actual(self, actual):
+        if not actual:
+            raise ConditionMismatchException()
+        return actual
+
 
 visible = Visible()
 appear = visible
 
 
 class Hidden(ElementCondition):
+    in_page_actual = 'return seleneIsDisplayed(element);'
+
     def match(self, webelement):
         # type: (SeleneElement) -> IWebElement
-        if webelement.is_displayed():
-            raise ConditionMismatchException()
+        self.match_actual(webelement.is_displayed())
         return webelement
 
+    def match_actual(self, actual):
+        if actual:
+            raise ConditionMismatchException()
+        return actual
+
 
 hidden = Hidden()
 disappear = hidden
@@ -236,52 +292,85 @@ class InDom(ElementCondition):
     """
     checks if element exist in DOM
     """
+    in_page_actual = 'return true;'
 
     def match(self, webelement):
         return webelement
 
+    def match_actual(self, actual):
+        return actual
+
 
 in_dom = InDom()
 exist = in_dom
 
 
 class Text(ElementCondition):
-    def __init__(self, expected_text):
+    def __init__(self, expected_text, strategy=None):
         self.expected_text = expected_text
+        self.strategy = text_strategies.checked(strategy)  # None means config.text_strategy
+
+    @property
+    def in_page_actual(self):
+        return text_strategies.in_page_text(text_strategies.resolved(self.strategy))
+
+    def fn(self, element):
+        # type: (SeleneElement) -> str
+        return self.match_actual(text_strategies.text_of(element, text_strategies.resolved(self.strategy)))
 
     def match(self, webelement):
-        actual_text = webelement.text
+        self.match_actual(text_strategies.webelement_text(webelement, text_strategies.resolved(self.strategy)))
+        return webelement
+
+    def match_actual(self, actual_text):
         if self.expected_text not in actual_text:
             raise ConditionMismatchException(expected=self.expected_text, actual=actual_text)
-        return webelement
+        return actual_text
 
 
 text = Text
 
 
 class ExactText(ElementCondition):
-    def __init__(self, expected_text):
+    def __init__(self, expected_text, strategy=None):
         self.expected_text = expected_text
+        self.strategy = text_strategies.checked(strategy)  # None means config.text_strategy
+
+    @property
+    def in_page_actual(self):
+        return text_strategies.in_page_text(text_strategies.resolved(self.strategy))
+
+    def fn(self, element):
+        # type: (SeleneElement) -> str
+        return self.match_actual(text_strategies.text_of(element, text_strategies.resolved(self.strategy)))
 
     def match(self, webelement):
-        actual_text = webelement.text
+        self.match_actual(text_strategies.webelement_text(webelement, text_strategies.resolved(self.strategy)))
+        return webelement
+
+    def match_actual(self, actual_text):
         if not self.expected_text == actual_text:
             raise ConditionMismatchException(expected=self.expected_text, actual=actual_text)
-        return webelement
+        return actual_text
 
 
 exact_text = ExactText
 
 
 class CssClass(ElementCondition):
+    in_page_actual = 'return seleneAttribute(element, "class");'
+
     def __init__(self, expected):
         self.expected = expected
 
     def match(self, webelement):
-        actual = webelement.get_attribute("class")
+        self.match_actual(webelement.get_attribute("class"))
+        return webelement
+
+    def match_actual(self, actual):
         if self.expected not in actual.split():
             raise ConditionMismatchException(expected=self.expected, actual='class attribute: {}'.format(actual))
-        return webelement
+        return actual
 
 
 css_class = CssClass
@@ -292,13 +381,20 @@ class Attribute(ElementCondition):
         self.name = name
         self.value = value
 
+    @property
+    def in_page_actual(self):
+        return 'return seleneAttribute(element, {name});'.format(name=json.dumps(self.name))
+
     def match(self, webelement):
-        actual = webelement.get_attribute(self.name)
+        self.match_actual(webelement.get_attribute(self.name))
+        return webelement
+
+    def match_actual(self, actual):
         if not self.value == actual:
             raise ConditionMismatchException(
                 expected='{name}="{value}"'.format(name=self.name, value=self.value),
                 actual='{name}="{value}"'.format(name=self.name, value=actual))
-        return webelement
+        return actual
 
 
 attribute = Attribute
@@ -329,32 +425,60 @@ class CollectionCondition(with_metaclass(ABCMeta, IEntityCondition)):
 
 
 class Texts(CollectionCondition):
-    def __init__(self, *expected):
+    """
+    matches texts of all elements, taken by one execute_script call for strategies other than the rendered one
+    (together with the search of elements if the collection locator can be processed in the page)
+    """
+
+    def __init__(self, *expected, strategy=None):
         self.expected = expected
+        self.strategy = text_strategies.checked(strategy)  # None means config.text_strategy
+
+    def fn(self, elements):
+        # type: (SeleneCollection) -> List[str]
+        return self.match_texts(text_strategies.texts_of(elements, text_strategies.resolved(self.strategy)))
 
     def match(self, webelements):
-        actual = [it.text for it in webelements]
+        self.match_texts(text_strategies.webelements_texts(webelements, text_strategies.resolved(self.strategy)))
+        return webelements
+
+    def match_texts(self, actual):
+        # type: (List[str]) -> List[str]
         if not (len(actual) == len(self.expected) and all(lmap(operator.contains, actual, self.expected))):
             raise ConditionMismatchException(
                 expected=self.expected,
                 actual=actual)
-        return webelements
+        return actual
 
 
 texts = Texts
 
 
 class ExactTexts(CollectionCondition):
-    def __init__(self, *expected):
+    """
+    matches texts of all elements, taken by one execute_script call for strategies other than the rendered one,
+    see Texts
+    """
+
+    def __init__(self, *expected, strategy=None):
         self.expected = expected
+        self.strategy = text_strategies.checked(strategy)  # None means config.text_strategy
+
+    def fn(self, elements):
+        # type: (SeleneCollection) -> List[str]
+        return self.match_texts(text_strategies.texts_of(elements, text_strategies.resolved(self.strategy)))
 
     def match(self, webelements):
-        actual = [it.text for it in webelements]
+        self.match_texts(text_strategies.webelements_texts(webelements, text_strategies.resolved(self.strategy)))
+        return webelements
+
+    def match_texts(self, actual):
+        # type: (List[str]) -> List[str]
         if not (len(actual) == len(self.expected) and all(lmap(operator.eq, actual, self.expected))):
             raise ConditionMismatchException(
                 expected=self.expected,
                 actual=actual)
-        return webelements
+        return actual
 
 
 exact_texts = ExactTexts
@@ -364,13 +488,21 @@ class Size(CollectionCondition):
     def __init__(self, expected):
         self.expected = expected
 
+    def fn(self, elements):
+        # type: (SeleneCollection) -> int
+        return self.match_size(elements.get_actual_size())
+
     def match(self, webelements):
-        actual = len(webelements)
+        self.match_size(len(webelements))
+        return webelements
+
+    def match_size(self, actual):
+        # type: (int) -> int
         if not actual == self.expected:
             raise ConditionMismatchException(
                 expected=self.expected,
                 actual=actual)
-        return webelements
+        return actual
 
 
 size = Size
@@ -381,13 +513,71 @@ class SizeAtLeast(CollectionCondition):
     def __init__(self, expected):
         self.expected = expected
 
+    def fn(self, elements):
+        # type: (SeleneCollection) -> int
+        return self.match_size(elements.get_actual_size())
+
     def match(self, webelements):
-        actual = len(webelements)
+        self.match_size(len(webelements))
+        return webelements
+
+    def match_size(self, actual):
+        # type: (int) -> int
         if not actual >= self.expected:
             raise ConditionMismatchException(
                 expected='>= {}'.format(self.expected),
                 actual=actual)
-        return webelements
+        return actual
 
 
 size_at_least = SizeAtLeast
+
+
+class Each(CollectionCondition):
+    """
+    matches the element condition on all elements of collection at once,
+    by one execute_script call if both the condition and the collection locator can be processed in the page
+    """
+
+    def __init__(self, condition):
+        # type: (ElementCondition) -> None
+        self._condition = condition
+
+    def description(self):
+        return 'each {}'.format(self._condition.description())
+
+    def fn(self, elements):
+        # type: (SeleneCollection) -> SeleneCollection
+        in_page_actual = in_page_actual_of(self._condition)
+        query = elements._locator.page_query() if in_page_actual else None
+        if query is not None:
+            actuals = query.execute(
+                elements._webdriver,
+                'return nodes.map(function (element) { %s });' % in_page_actual)
+            self._raise_if_failed(self._condition.match_actual, actuals)
+        else:
+            self._raise_if_failed(self._condition.fn, elements._as_cached_list())
+        return elements
+
+    def match(self, webelements):
+        self._raise_if_failed(self._condition.match, webelements)
+        return webelements
+
+    @staticmethod
+    def _raise_if_failed(match, entities):
+        failures = []
+        for index, entity in enumerate(entities):
+            try:
+                match(entity)
+            except Exception as reason:
+                failures.append((index, reason))
+        if failures:
+            raise ConditionMismatchException(
+                message='condition did not match for elements at indexes: {indexes}{reasons}'.format(
+                    indexes=', '.join(str(index) for index, reason in failures),
+                    reasons=''.join('\n\t\t[{index}]: {name}: {reason}'.format(
+                        index=index, name=reason.__class__.__name__, reason=reason)
+                        for index, reason in failures)))
+
+
+each = Each
@@ -27,7 +27,6 @@ import time
 
 from selene.browsers import BrowserName
 from selene.environment import *
-from selene.helpers import env
 
 timeout = int(env(SELENE_TIMEOUT, 4))
 poll_during_waits = float(env(SELENE_POLL_DURING_WAITS, 0.1))
@@ -42,6 +41,23 @@ cash_elements = env(SELENE_CACHE_ELEMENTS) == 'True' or False
 '''To cash all elements after first successful find
       config.cash_elements = True'''
 
+intern_elements = env(SELENE_INTERN_ELEMENTS) == 'True' or False
+'''To represent the same DOM element found again in the same session by the same webelement object
+      config.intern_elements = True'''
+
+stale_element_retries = int(env(SELENE_STALE_ELEMENT_RETRIES, 3))
+'''How many times an element, that became stale, is found again right away, before waiting as for any other error
+      config.stale_element_retries = 0'''
+
+text_strategy = env(SELENE_TEXT_STRATEGY, 'rendered')
+'''How texts of elements are taken by SeleneElement#text and text conditions, see selene.text_strategies.TextStrategy
+      config.text_strategy = 'renderedInPage'  # texts of collections are taken by one script call
+      config.text_strategy = 'textContent'  # does not force layout, but includes texts of hidden elements'''
+
+fast_set_value = env(SELENE_FAST_SET_VALUE) == 'True' or False
+'''To set values of text fields by one script call, dispatching input and change events, instead of typing them
+      config.fast_set_value = True'''
+
 browser_name = env(SELENE_BROWSER_NAME, BrowserName.CHROME)
 
 start_maximized = False if env(SELENE_START_MAXIMIZED) == 'False' else True
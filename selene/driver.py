@@ -27,10 +27,15 @@ from future.utils import with_metaclass
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from selene import batching
+from selene import frames
+from selene import page_query
 from selene.abctypes.webdriver import IWebDriver
 from selene.common.delegation import DelegatingMeta
 from selene.common.none_object import NoneObject
-from selene.elements import SeleneElement, SeleneCollection
+from selene.elements import SeleneElement, SeleneCollection, WebDriverWebElementLocator, \
+    WebdriverListWebElementLocator
+from selene.helpers import css_or_by_to_by
 
 
 class IWebDriverSource(with_metaclass(ABCMeta, object)):
@@ -107,15 +112,100 @@ class SeleneDriver(with_metaclass(DelegatingMeta, IWebDriver)):  # todo: conside
     elements = all
     find_all = all
 
+    def frame(self, css_selector_or_by):
+        # type: (...) -> SeleneFrame
+        """
+        Returns the context of elements inside the frame, which is switched to automatically when they are found:
+            frame = driver.frame('#editor')
+            frame.element('body').set_value('Hello')
+            driver.element('#save').click()  # switches back to the top level document
+        """
+        return SeleneFrame(self, (css_or_by_to_by(css_selector_or_by),))
+
+    def get(self, url):
+        batching.flush()
+        self._webdriver.get(url)
+        frames.reset(self)
+
+    def set_script_timeout(self, time_to_wait):
+        # remembered to be restored after asynchronous scripts of selene with their own timeouts
+        page_query.remember_script_timeout(self, time_to_wait)
+        self._webdriver.set_script_timeout(time_to_wait)
+
+    # *** Commands of the page, executed after actions recorded in the active batch,
+    # in the frame switched to the last time (see selene.frames) ***
+
+    def execute_script(self, script, *args):
+        batching.flush()
+        return self._webdriver.execute_script(script, *args)
+
+    def execute_async_script(self, script, *args):
+        batching.flush()
+        return self._webdriver.execute_async_script(script, *args)
+
+    @property
+    def page_source(self):
+        batching.flush()
+        return self._webdriver.page_source
+
+    @property
+    def title(self):
+        batching.flush()
+        return self._webdriver.title
+
+    @property
+    def current_url(self):
+        batching.flush()
+        return self._webdriver.current_url
+
     # *** SearchContext methods ***
     def find_elements(self, by=By.ID, value=None):
+        batching.flush()
         return self._webdriver.find_elements(by, value)
         # return self.find_all((by, value))
 
     def find_element(self, by=By.ID, value=None):
+        batching.flush()
         return self._webdriver.find_element(by, value)
         # return self.find((by, value))
 
 
+class SeleneFrame(object):
+    """
+    Context of elements inside the frame (or nested frames), switched to automatically when the elements are found.
+    The frame switched to the last time is remembered, so elements of the same frame don't switch frames again.
+    """
+    __slots__ = ('_driver', '_path')
+
+    def __init__(self, driver, path):
+        # type: (SeleneDriver, Tuple[Tuple[str, str], ...]) -> None
+        self._driver = driver
+        self._path = path
+
+    def __str__(self):
+        return ''.join('frame_by%s.' % str(by) for by in self._path)
+
+    def frame(self, css_selector_or_by):
+        # type: (...) -> SeleneFrame
+        return SeleneFrame(self._driver, self._path + (css_or_by_to_by(css_selector_or_by),))
+
+    def element(self, css_selector_or_by):
+        return SeleneElement(
+            WebDriverWebElementLocator(css_or_by_to_by(css_selector_or_by), self._driver, self._path),
+            self._driver)
+
+    s = element
+    find = element
+
+    def all(self, css_selector_or_by):
+        return SeleneCollection(
+            WebdriverListWebElementLocator(css_or_by_to_by(css_selector_or_by), self._driver, self._path),
+            self._driver)
+
+    ss = all
+    elements = all
+    find_all = all
+
+
 _shared_web_driver_source = SharedWebDriverSource()
 _shared_driver = SeleneDriver(_shared_web_driver_source)
\ No newline at end of file
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import uuid
 import warnings
 import logging
 from _ast import Tuple, List
@@ -31,50 +32,125 @@ else:
     from collections.abc import Sequence
 
 from future.utils import with_metaclass
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, \
+    StaleElementReferenceException, JavascriptException, UnexpectedTagNameException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
+from selene import batching
 from selene import config
+from selene import frames
 from selene import helpers
+from selene import interning
+from selene import resolution
+from selene import text_strategies
 from selene.abctypes.conditions import IEntityCondition
 from selene.abctypes.locators import ISeleneWebElementLocator, ISeleneListWebElementLocator
 from selene.abctypes.search_context import ISearchContext
 from selene.abctypes.webdriver import IWebDriver
 from selene.abctypes.webelement import IWebElement
 from selene.common.delegation import DelegatingMeta
+from selene.exceptions import ConditionMismatchException
 from selene.helpers import css_or_by_to_by
+from selene.page_query import PageQuery, compiled_by, IN_PAGE_STRATEGIES
+from selene.snapshot import Snapshot, SNAPSHOT_OF_ELEMENT, SNAPSHOTS_OF_ELEMENTS, EXTRACT_OF_ELEMENTS, \
+    SCROLL_STEP_OF_ELEMENTS, WATCH_ELEMENTS, DRAIN_WATCHED, STOP_WATCHING, OPTIONS_OF_SELECT, as_numpy_records
 from selene.support import by
+from selene.text_strategies import TextStrategy, TEXT_OF_ELEMENT, TEXTS_OF_ELEMENTS
 from selene.support.conditions import be
 from selene.support.conditions import have
 from selene.wait import wait_for
-from selene.conditions import not_, is_matched
-
-try:
-    from functools import lru_cache
-except ImportError:
-    from backports.functools_lru_cache import lru_cache
+from selene.conditions import not_, in_page_actual_of, is_matched_actual, each
 
 logger = logging.getLogger("Selene Logger")
 
 
+def _page_query_of(search_context):
+    # type: (ISearchContext) -> PageQuery
+    if isinstance(search_context, IWebDriver):
+        return PageQuery.of_document()
+    if isinstance(search_context, SeleneElement):
+        return search_context._locator.page_query()
+    if isinstance(search_context, IWebElement):
+        return PageQuery.of_webelement(search_context)
+    return None
+
+
+def _webdriver_of(search_context):
+    # type: (ISearchContext) -> IWebDriver
+    if isinstance(search_context, IWebDriver):
+        return search_context
+    if isinstance(search_context, SeleneElement):
+        return search_context._webdriver
+    return search_context.parent
+
+
+def _in_page_query_of(search_context, by):
+    # type: (ISearchContext, Tuple[str, str]) -> PageQuery
+    context = _page_query_of(search_context)
+    if context is None:
+        context = PageQuery.of_webelement(
+            search_context.get_actual_webelement() if isinstance(search_context, SeleneElement) else search_context)
+    return context.all(by)
+
+
+def _find(search_context, by):
+    # type: (ISearchContext, Tuple[str, str]) -> IWebElement
+    """
+    finds element by webdriver, or in the page if the locator is supported only in the page (like by.right_of)
+    """
+    if by[0] not in IN_PAGE_STRATEGIES:
+        return search_context.find_element(*by)
+    return _in_page_query_of(search_context, by).first().find(_webdriver_of(search_context))
+
+
+def _find_all(search_context, by):
+    # type: (ISearchContext, Tuple[str, str]) -> List[IWebElement]
+    if by[0] not in IN_PAGE_STRATEGIES:
+        return search_context.find_elements(*by)
+    return _in_page_query_of(search_context, by).find_all(_webdriver_of(search_context))
+
+
+def _in_frame_description(frame):
+    return ''.join('frame_by%s.' % str(by) for by in frame or ())
+
+
 # todo: consider renaming/refactoring to WebDriverWebElementLocator...
 class WebDriverWebElementLocator(ISeleneWebElementLocator):
-    def __init__(self, by, search_context):
-        # type: (Tuple[By, str], ISearchContext) -> None
+    __slots__ = ('_by', '_search_context', '_frame')
+
+    def __init__(self, by, search_context, frame=()):
+        # type: (Tuple[By, str], ISearchContext, Tuple[Tuple[By, str], ...]) -> None
         self._by = by
         self._search_context = search_context
+        # frames are switched to only for the search in the document
+        self._frame = frame if isinstance(search_context, IWebDriver) else None
 
     @property
     def description(self):
-        return 'first_by%s' % str(self._by)
+        return _in_frame_description(self._frame) + 'first_by%s' % str(self._by)
 
     def find(self):
-        return self._search_context.find_element(*self._by)
+        if self._frame is None:
+            return _find(self._search_context, self._by)
+        return frames.within(self._search_context, self._frame, lambda: _find(self._search_context, self._by))
+
+    def page_query(self):
+        context = PageQuery.of_document(self._frame) if self._frame is not None \
+            else _page_query_of(self._search_context)
+        found = context and context.all(self._by)
+        return found and found.first()
+
+    def forget_stale(self):
+        if self._frame:
+            # the frame may be re-rendered, so it is switched to from the top level document next time
+            frames.forget(self._search_context)
 
 
 class InnerWebElementLocator(ISeleneWebElementLocator):
+    __slots__ = ('_by', '_element')
+
     def __init__(self, by, element):
         # type: (Tuple[By, str], SeleneElement) -> None
         self._by = by
@@ -86,24 +162,79 @@ class InnerWebElementLocator(ISeleneWebElementLocator):
 
     def find(self):
         # return self._element.get_actual_webelement().find_element(*self._by)
-        return wait_for(self._element, be.in_dom, config.timeout, config.poll_during_waits).find_element(*self._by)
+        return resolution.within(
+            self._element,
+            lambda: wait_for(
+                self._element, be.in_dom, resolution.nested_timeout(config.timeout), config.poll_during_waits),
+            lambda it: _find(it, self._by))
+
+    def page_query(self):
+        context = self._element._locator.page_query()
+        found = context and context.all(self._by)
+        return found and found.first()
+
+    def forget_stale(self):
+        self._element._locator.forget_stale()
 
 
 class CachingWebElementLocator(ISeleneWebElementLocator):
+    __slots__ = ('_element', '_webelement')
+
     @property
     def description(self):
         return "Caching %s" % (self._element,)
 
     # todo: will it cash kine of "first wrong webelement"? i.e. invisible element
-    @lru_cache()
     def find(self):
-        return self._element.get_actual_webelement()
+        if self._webelement is None:
+            self._webelement = self._element.get_actual_webelement()
+        return self._webelement
+
+    def page_query(self):
+        return PageQuery.of_webelement(self.find())
+
+    def forget_stale(self):
+        self._webelement = None
 
     def __init__(self, element):
         self._element = element
+        self._webelement = None
+
+
+class CachedIndexedWebElementLocator(ISeleneWebElementLocator):
+    """
+    Locator of the already found element of the collection,
+    the description is rendered from the collection only when needed (i.e. in error messages)
+    """
+    __slots__ = ('_webelement', '_index', '_collection')
+
+    @property
+    def description(self):
+        return '${this}[${index}]'.format(this=self._collection, index=self._index)
+
+    def find(self):
+        if self._webelement is None:
+            self._webelement = IndexedWebElementLocator(self._index, self._collection).find()
+        return self._webelement
+
+    def page_query(self):
+        if self._webelement is None:
+            return IndexedWebElementLocator(self._index, self._collection).page_query()
+        return PageQuery.of_webelement(self._webelement)
+
+    def forget_stale(self):
+        self._webelement = None
+
+    def __init__(self, webelement, index, collection):
+        # type: (IWebElement, int, SeleneCollection) -> None
+        self._webelement = webelement
+        self._index = index
+        self._collection = collection
 
 
 class WrappedWebElementLocator(ISeleneWebElementLocator):
+    __slots__ = ('_webelement', '_description')
+
     @property
     def description(self):
         return self._description
@@ -111,21 +242,97 @@ class WrappedWebElementLocator(ISeleneWebElementLocator):
     def find(self):
         return self._webelement
 
+    def page_query(self):
+        return PageQuery.of_webelement(self._webelement)
+
     def __init__(self, webelement, description):
         self._webelement = webelement
         self._description = description
 
 
+class PrefetchedWebElementLocator(ISeleneWebElementLocator):
+    """
+    Locator of the element found in advance (e.g. by SeleneCollection#prefetch_children),
+    that falls back to the lazy locator if the element was not found or became stale
+    """
+    __slots__ = ('_webelement', '_fallback')
+
+    @property
+    def description(self):
+        return self._fallback.description
+
+    def find(self):
+        if self._webelement is None:
+            return self._fallback.find()
+        return self._webelement
+
+    def page_query(self):
+        if self._webelement is None:
+            return self._fallback.page_query()
+        return PageQuery.of_webelement(self._webelement)
+
+    def forget_stale(self):
+        if self._webelement is None:
+            self._fallback.forget_stale()
+        self._webelement = None
+
+    def __init__(self, webelement, fallback):
+        # type: (Optional[IWebElement], ISeleneWebElementLocator) -> None
+        self._webelement = webelement
+        self._fallback = fallback
+
+
+class _PartOfSizeAtLeast(IEntityCondition):
+    """
+    matches have.size_at_least(size) and returns the part of the collection taken from the same found webelements,
+    by one execute_script call if the collection locator can be processed in the page
+    """
+
+    def __init__(self, size, part, in_page_part, *args):
+        # part - function of the list of webelements,
+        # in_page_part - js expression of `nodes` and `args` returning the same, null if not found
+        self._size = have.size_at_least(size)
+        self._part = part
+        self._in_page_part = in_page_part
+        self._args = args
+
+    def description(self):
+        return self._size.description()
+
+    def fn(self, collection):
+        # type: (SeleneCollection) -> object
+        query = collection._locator.page_query()
+        if query is None:
+            return self._part(self._size.match(collection.get_actual_webelements()))
+        batching.flush()
+        size, part = query.execute(
+            collection._webdriver, 'return [nodes.length, %s];' % self._in_page_part, *self._args)
+        self._size.match_size(size)
+        if part is None:
+            raise NoSuchElementException('Element was not found in the page by: %s' % query)
+        return part
+
+
 # todo: PyCharm generates abstract methods impl before __init__ method.
 # todo: Should we use this order convention? like below...
 class IndexedWebElementLocator(ISeleneWebElementLocator):
+    __slots__ = ('_index', '_collection')
+
     def find(self):
         # return self._collection.get_actual_webelements()[self._index]
         return wait_for(
             self._collection,
-            have.size_at_least(self._index + 1),
-            config.timeout,
-            config.poll_during_waits)[self._index]
+            _PartOfSizeAtLeast(
+                self._index + 1,
+                lambda webelements: webelements[self._index],
+                'nodes[args[0] < 0 ? nodes.length + args[0] : args[0]] || null',
+                self._index),
+            resolution.nested_timeout(config.timeout),
+            config.poll_during_waits)
+
+    def page_query(self):
+        collection = self._collection._locator.page_query()
+        return collection and collection.at(self._index)
 
     @property
     def description(self):
@@ -138,20 +345,37 @@ class IndexedWebElementLocator(ISeleneWebElementLocator):
 
 
 class WebdriverListWebElementLocator(ISeleneListWebElementLocator):
-    def __init__(self, by, search_context):
-        # type: (Tuple[By, str], ISearchContext) -> None
+    __slots__ = ('_by', '_search_context', '_frame')
+
+    def __init__(self, by, search_context, frame=()):
+        # type: (Tuple[By, str], ISearchContext, Tuple[Tuple[By, str], ...]) -> None
         self._by = by
         self._search_context = search_context
+        # frames are switched to only for the search in the document
+        self._frame = frame if isinstance(search_context, IWebDriver) else None
 
     @property
     def description(self):
-        return 'all_by%s' % str(self._by)
+        return _in_frame_description(self._frame) + 'all_by%s' % str(self._by)
 
     def find(self):
-        return self._search_context.find_elements(*self._by)
+        if self._frame is None:
+            return _find_all(self._search_context, self._by)
+        return frames.within(self._search_context, self._frame, lambda: _find_all(self._search_context, self._by))
+
+    def page_query(self):
+        context = PageQuery.of_document(self._frame) if self._frame is not None \
+            else _page_query_of(self._search_context)
+        return context and context.all(self._by)
+
+    def forget_stale(self):
+        if self._frame:
+            frames.forget(self._search_context)
 
 
 class InnerListWebElementLocator(ISeleneListWebElementLocator):
+    __slots__ = ('_by', '_element')
+
     def __init__(self, by, element):
         # type: (Tuple[By, str], SeleneElement) -> None
         self._by = by
@@ -163,16 +387,48 @@ class InnerListWebElementLocator(ISeleneListWebElementLocator):
 
     def find(self):
         # return self._element.get_actual_webelement().find_elements(*self._by)
-        return wait_for(self._element, be.in_dom, config.timeout, config.poll_during_waits) \
-            .find_elements(*self._by)
+        return resolution.within(
+            self._element,
+            lambda: wait_for(
+                self._element, be.in_dom, resolution.nested_timeout(config.timeout), config.poll_during_waits),
+            lambda it: _find_all(it, self._by))
+
+    def page_query(self):
+        context = self._element._locator.page_query()
+        return context and context.all(self._by)
+
+    def forget_stale(self):
+        self._element._locator.forget_stale()
+
+
+def _filtered_in_page(collection, condition):
+    # type: (SeleneCollection, IEntityCondition) -> Optional[List[IWebElement]]
+    """
+    Returns webelements of the collection matching the condition, checked by one execute_script call,
+    or None if either the condition or the collection locator can't be processed in the page
+    """
+    in_page_actual = in_page_actual_of(condition)
+    query = collection._locator.page_query() if in_page_actual else None
+    if query is None:
+        return None
+    found = query.execute(
+        collection._webdriver,
+        'return nodes.map(function (element) { return [element, (function (element) { %s })(element)]; });'
+        % in_page_actual)
+    return [webelement for webelement, actual in found if is_matched_actual(condition, actual)]
 
 
 class FilteredListWebElementLocator(ISeleneListWebElementLocator):
+    __slots__ = ('_condition', '_collection')
+
     def find(self):
+        filtered = _filtered_in_page(self._collection, self._condition)
+        if filtered is not None:
+            return filtered
         elements = self._collection._as_cached_list()
         filtered = [element()
                     for element in elements
-                    if element.matching(self._condition)]
+                    if element.matches_now(self._condition)]
         return filtered
 
     @property
@@ -186,13 +442,28 @@ class FilteredListWebElementLocator(ISeleneListWebElementLocator):
 
 
 class SlicedListWebElementLocator(ISeleneListWebElementLocator):
+    __slots__ = ('_slice', '_collection')
+
     def find(self):
         # webelements = self._collection()
-        webelements = wait_for(self._collection,
-                               have.size_at_least(self._slice.stop),
-                               config.timeout,
-                               config.poll_during_waits)
-        return webelements[self._slice.start:self._slice.stop:self._slice.step]
+        # only positive stop requires some elements to exist, other slices of the empty collection are just empty
+        stop = self._slice.stop
+        requires_size = stop is not None and stop > 0
+        sliced = _PartOfSizeAtLeast(
+            stop if requires_size else 0,
+            lambda webelements: webelements[self._slice],
+            'seleneSlice(nodes, args[0], args[1], args[2])',
+            self._slice.start, self._slice.stop, self._slice.step)
+        if not requires_size:
+            return sliced.fn(self._collection)
+        return wait_for(self._collection,
+                        sliced,
+                        resolution.nested_timeout(config.timeout),
+                        config.poll_during_waits)
+
+    def page_query(self):
+        query = self._collection._locator.page_query()
+        return query.slice(self._slice) if query is not None else None
 
     @property
     def description(self):
@@ -205,10 +476,17 @@ class SlicedListWebElementLocator(ISeleneListWebElementLocator):
 
 
 class FoundByConditionWebElementLocator(ISeleneWebElementLocator):
+    __slots__ = ('_condition', '_collection')
+
     def find(self):
-        for element in self._collection._as_cached_list():
-            if element.matching(self._condition):
-                return element()
+        filtered = _filtered_in_page(self._collection, self._condition)
+        if filtered is not None:
+            if filtered:
+                return filtered[0]
+        else:
+            for element in self._collection._as_cached_list():
+                if element.matches_now(self._condition):
+                    return element()
         raise NoSuchElementException('Element was not found by: %s' % (self._condition,))
 
     @property
@@ -221,13 +499,249 @@ class FoundByConditionWebElementLocator(ISeleneWebElementLocator):
         self._collection = collection
 
 
+_BY_STRATEGIES = frozenset(value for name, value in vars(By).items() if not name.startswith('_'))
+
+
+def _compiled_column(spec):
+    """
+    converts column spec to the [using, value, field] form supported in page, where spec is one of:
+        css/xpath selector or by of the cell inside the row - to take the text of the cell
+        (selector or by, field) - to take the field of the cell, see snapshot fields
+        (None, field) - to take the field of the row itself
+    """
+    if isinstance(spec, tuple) and len(spec) == 2 and spec[0] not in _BY_STRATEGIES:
+        cell, field = spec
+    else:
+        cell, field = spec, 'text'
+    if cell is None:
+        return [None, None, field]
+    compiled = compiled_by(css_or_by_to_by(cell))
+    if compiled is None:
+        raise ValueError('cell locator {} can not be resolved in the page'.format(cell))
+    return list(compiled) + [field]
+
+
+class _ExecutedInPage(IEntityCondition):
+    """
+    Executes js function_body in the page with `nodes` - actual elements of the entity,
+    resolved in the same execute_script call if possible.
+    Is used as a condition to wait until the entity is found.
+    """
+
+    def __init__(self, description, function_body, *args, asynchronous=False, timeout=None):
+        self._description = description
+        self._function_body = function_body
+        self._args = args
+        self._asynchronous = asynchronous
+        self._timeout = timeout
+
+    def description(self):
+        return self._description
+
+    def fn(self, entity):
+        # type: (Union[SeleneElement, SeleneCollection]) -> object
+        query = entity._locator.page_query()
+        if query is None:
+            query = PageQuery.of_webelements(entity.get_actual_webelements()) \
+                if isinstance(entity, SeleneCollection) \
+                else PageQuery.of_webelement(entity.get_actual_webelement())
+        if self._asynchronous:
+            return query.execute_async(entity._webdriver, self._function_body, *self._args, timeout=self._timeout)
+        return query.execute(entity._webdriver, self._function_body, *self._args)
+
+
+# sets the value (args[0]) of the text field natively, see seleneSetValue, returns:
+#     'unchanged' if the field already has the value, 'set' if the value was set,
+#     'keys' if the value should be typed (the field is not a text field or did not accept the value as is),
+#     'not ready' if the field is not visible or not editable yet
+_SET_VALUE = '''
+var element = nodes[0], value = args[0];
+if (!seleneIsDisplayed(element) || !seleneIsEnabled(element) || element.readOnly) {
+    return 'not ready';
+}
+if (element.value === value) {
+    return 'unchanged';
+}
+var tag = element.tagName.toLowerCase();
+var type = (element.getAttribute('type') || 'text').toLowerCase();
+if (!(tag === 'textarea'
+        || (tag === 'input' && ['text', 'search', 'email', 'url', 'tel', 'password', 'number'].indexOf(type) >= 0))) {
+    return 'keys';
+}
+seleneSetValue(element, value);
+return element.value === value ? 'set' : 'keys';
+'''
+
+
+# fills fields of the form (nodes[0]) with [key, value] pairs of args[0], where key is the name of the field
+# or css selector inside the form, returns the reasons of failures by keys
+_FILL = r'''
+function unusable(control) {
+    if (!seleneIsEnabled(control)) {
+        return 'field is disabled';
+    }
+    if (control.readOnly) {
+        return 'field is readonly';
+    }
+    if (control.type !== 'hidden' && !seleneIsDisplayed(control)) {
+        return 'field is not visible';
+    }
+    return null;
+}
+function fill(form, key, value) {
+    var byName = '[name="' + key.replace(/(["\\])/g, '\\$1') + '"]';
+    var controls = Array.prototype.slice.call(form.querySelectorAll(byName));
+    if (!controls.length) {
+        try {
+            controls = Array.prototype.slice.call(form.querySelectorAll(key));
+        } catch (error) {
+            controls = [];
+        }
+    }
+    if (!controls.length) {
+        return 'field was not found';
+    }
+    var control = controls[0];
+    var tag = control.tagName.toLowerCase(), type = (control.type || '').toLowerCase();
+    var reason = null;
+    if (tag === 'select') {
+        return unusable(control) || seleneSelectOptions(control, value, 'any');
+    }
+    if (type === 'checkbox' || type === 'radio') {
+        var wanted = typeof value === 'boolean' ? [] : [].concat(value).map(String);
+        var missing = wanted.filter(function (option) {
+            return !controls.some(function (box) { return box.value === option; });
+        });
+        if (missing.length) {
+            return 'no ' + type + ' with value: ' + missing.join(', ');
+        }
+        var checked = typeof value === 'boolean'
+            ? function (box) { return box === control ? value : box.checked; }
+            : function (box) { return wanted.indexOf(box.value) >= 0; };
+        controls.forEach(function (box) {
+            if (reason === null && box.checked !== checked(box) && !(type === 'radio' && box.checked)) {
+                reason = unusable(box);
+                if (reason === null) {
+                    box.click();
+                }
+            }
+        });
+        return reason;
+    }
+    reason = unusable(control);
+    if (reason === null && control.value !== String(value)) {
+        seleneSetValue(control, String(value));
+    }
+    return reason;
+}
+var failures = {}, errors = [];
+args[0].forEach(function (field) {
+    var reason;
+    try {
+        reason = fill(nodes[0], field[0], field[1]);
+    } catch (error) {
+        reason = String(error);
+        errors.push(field[0]);
+    }
+    if (reason !== null) {
+        failures[field[0]] = reason;
+    }
+});
+return [failures, errors];
+'''
+
+
+class _SetValueInPage(_ExecutedInPage):
+    """
+    Sets the value of the text field in the page, see _SET_VALUE, waiting for the field to be visible and editable
+    """
+
+    def __init__(self, value):
+        super(_SetValueInPage, self).__init__('Visible and editable for setting value', _SET_VALUE, value)
+
+    def fn(self, element):
+        # type: (SeleneElement) -> str
+        outcome = super(_SetValueInPage, self).fn(element)
+        if outcome == 'not ready':
+            raise ConditionMismatchException(expected='visible and editable', actual='not visible or not editable')
+        return outcome
+
+
+# selects options of the select (nodes[0]) by values or texts (args[0], by args[1]), see seleneSelectOptions,
+# returns the reason why they can't be selected yet, [kind, reason] if they can't be selected at all
+# (kind is 'tag' or one of seleneSelectionError), or null
+_SELECT = '''
+var select = nodes[0];
+if (select.tagName.toLowerCase() !== 'select') {
+    return ['tag', 'element is not a select'];
+}
+var error = seleneSelectionError(select, args[0], args[1]);
+if (error !== null) {
+    return error;
+}
+if (!seleneIsDisplayed(select)) {
+    return 'select is not visible';
+}
+if (!seleneIsEnabled(select)) {
+    return 'select is disabled';
+}
+return seleneSelectOptions(select, args[0], args[1]);
+'''
+
+
+class _PerformedInPage(_ExecutedInPage):
+    """
+    Performs the action in the page, that returns null if it was performed, the reason why it can't be performed yet,
+    or the list describing why it can't be performed at all, that is returned to fail without waiting
+    """
+
+    def fn(self, entity):
+        # type: (Union[SeleneElement, SeleneCollection]) -> Optional[list]
+        reason = super(_PerformedInPage, self).fn(entity)
+        if isinstance(reason, list):
+            return reason
+        if reason is not None:
+            raise ConditionMismatchException(message=reason)
+        return None
+
+
+def _recovering_from_stale(entity, command):
+    """
+    calls command on the entity, and if the webelement found by the entity locator (or its parents) became stale,
+    lets the locator forget it and calls command again immediately, up to config.stale_element_retries times
+    """
+    retries = config.stale_element_retries
+    while True:
+        try:
+            return command(entity)
+        except StaleElementReferenceException:
+            if retries <= 0:
+                raise
+            retries -= 1
+            entity._locator.forget_stale()
+
+
+class _RecoveringFromStale(IEntityCondition):
+
+    def __init__(self, condition):
+        self._condition = condition
+
+    def description(self):
+        return self._condition.description()
+
+    def fn(self, entity):
+        return _recovering_from_stale(entity, self._condition.fn)
+
+
 def _wait_with_screenshot(webdriver, entity, condition, timeout=None, polling=None):
+    # actions recorded in the active batch are performed before any other command
+    batching.flush()
     if timeout is None:
         timeout = config.timeout
     if polling is None:
         polling = config.poll_during_waits
     try:
-        return wait_for(entity, condition, timeout, polling)
+        return wait_for(entity, _RecoveringFromStale(condition), timeout, polling)
     except TimeoutException as e:
         if config.take_screenshots:
             screenshot = helpers.take_screenshot(webdriver, )
@@ -239,10 +753,14 @@ def _wait_with_screenshot(webdriver, entity, condition, timeout=None, polling=No
 
 
 class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
+    __slots__ = ('_locator', '_webdriver')
+
     @property
     def __delegate__(self):
         # type: () -> IWebElement
-        return self._locator.find()
+        # actions recorded in the active batch are performed before the webelement is used
+        batching.flush()
+        return interning.interned(self._locator.find())
 
     # todo: is this alias needed?
     def get_actual_webelement(self):
@@ -287,13 +805,17 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
         # type: (ISeleneWebElementLocator, IWebDriver) -> None
         self._locator = selene_locator
         self._webdriver = webdriver
-        self._actions_chains = ActionChains(webdriver)
+
+    def _actions(self):
+        return ActionChains(self._webdriver)
 
     def __str__(self):
         return self._locator.description
 
     def _execute_on_webelement(self, command, condition=be.or_not_to_be):
-        return command(_wait_with_screenshot(self._webdriver, self, condition))
+        return _recovering_from_stale(
+            self,
+            lambda it: command(_wait_with_screenshot(it._webdriver, it, condition)))
 
     # *** Relative elements ***
 
@@ -351,6 +873,33 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
         except Exception:
             return False
 
+    def matches_now(self, condition):
+        # type: (IEntityCondition) -> bool
+        """
+        Checks the condition once, without waiting for the element or its parents to appear,
+        by one execute_script call if both the condition and the element locator can be processed in the page
+        """
+        in_page_actual = in_page_actual_of(condition)
+        query = self._locator.page_query() if in_page_actual else None
+        if query is not None:
+            batching.flush()
+            try:
+                return is_matched_actual(condition, query.execute(
+                    self._webdriver, 'return (function (element) { %s })(nodes[0]);' % in_page_actual))
+            except NoSuchElementException:
+                # conditions like not_(be.in_dom) may match absent elements, so they are checked as usual
+                pass
+        try:
+            with resolution.probing():
+                condition.fn(self)
+            return True
+        except Exception:
+            return False
+
+    def exists_now(self):
+        # type: () -> bool
+        return self.matches_now(be.in_dom)
+
     # *** Asserts (Explicit waits) ***
 
     def should(self, condition, timeout=None):
@@ -389,21 +938,47 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
     def should_not_have(self, condition, timeout=None):
         return self.should_not(condition, timeout)
 
+    # *** Queries ***
+
+    def snapshot(self, *fields):
+        # type: (*str) -> Snapshot
+        """
+        Takes values of all fields by one execute_script call, e.g.:
+            element.snapshot('text', 'value', 'displayed', 'enabled', 'rect', 'css:color')
+        Fields are text, tag_name, displayed, enabled, selected, rect, location, size,
+        css:<property name> for css values and <attribute name> for any other attribute.
+        """
+        values = _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage('Snapshot of {}'.format(fields), SNAPSHOT_OF_ELEMENT, list(fields)))
+        return Snapshot(fields, values)
+
     # *** Additional actions ***
 
     def double_click(self):
         self._execute_on_webelement(
-            lambda it: self._actions_chains.double_click(it).perform(),
+            lambda it: self._actions().double_click(it).perform(),
             condition=be.visible)
         return self
 
     def context_click(self):
-        self._execute_on_webelement(lambda it: self._actions_chains.context_click(it).perform(),
+        self._execute_on_webelement(lambda it: self._actions().context_click(it).perform(),
                                     condition=be.visible)
         return self
 
-    def set(self, new_text_value):
+    def set(self, new_text_value, fast=None):
+        """
+        Sets the value of the field by clearing it and typing the new value, or with fast=True
+        (config.fast_set_value by default) - by assigning the value in the page and dispatching input and change
+        events by one execute_script call, doing nothing if the field already has the value,
+        and typing it as usual for non text fields or if the field did not accept the value as is
+        """
         logger.info(f"Set value - {new_text_value}")
+        if batching.recorded(self, 'set', new_text_value):
+            return self
+        if (config.fast_set_value if fast is None else fast) \
+                and _wait_with_screenshot(self._webdriver, self, _SetValueInPage(str(new_text_value))) != 'keys':
+            return self
 
         def clear_and_send_keys(webelement):
             webelement.clear()
@@ -417,12 +992,43 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
 
     set_value = set
 
+    def select(self, value=None, text=None):
+        """
+        Selects options of the select element in the page by one execute_script call, firing input and change events,
+        e.g. `s('#plan').select(text='Pro')`, see SeleneSelect#select
+        """
+        SeleneSelect(self).select(value=value, text=text)
+        return self
+
+    def fill(self, fields):
+        # type: (Dict[str, object]) -> Dict[str, str]
+        """
+        Fills fields of the form (or any other container) by one execute_script call, e.g.:
+            failures = s('form').fill({'email': 'bob@example.com', 'agree': True, 'plan': 'pro', '#note': 'Hi'})
+        Fields are found inside the element by names, or by css selectors if there are no fields with such names.
+        Values are set (with input and change events) for text fields, selected by values or texts for selects
+        (lists for multiple selects), checked for radio buttons by values, and checked or unchecked for checkboxes
+        by bool values (or by lists of values for checkboxes with the same name), clicking them.
+        Fields are filled in the order of the dict, without waiting for them.
+        Returns the reasons of failures by the keys of fields that were not filled, empty if all were.
+        Raises JavascriptException listing fields that failed with errors in the page (like file inputs),
+        after all other fields are filled.
+        """
+        failures, errors = _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage('Fill of {}'.format(list(fields)), _FILL, [[key, value] for key, value in fields.items()]))
+        if errors:
+            raise JavascriptException('fields {} of {} were not filled because of errors in the page: {}'.format(
+                ', '.join(errors), self, '; '.join('{}: {}'.format(key, failures[key]) for key in errors)))
+        return failures
+
     def scroll_to(self):
 
         def js_scroll_to(webelement):
             location = webelement.location
-            self._webdriver.execute_script("window.scrollTo({x},{y});".format(x=location['x'],
-                                                                              y=location['y']))
+            # in the frame of the element, switched to when it was found
+            frames.unwrapped(self._webdriver).execute_script("window.scrollTo({x},{y});".format(x=location['x'],
+                                                                                               y=location['y']))
         self._execute_on_webelement(
             js_scroll_to,
             condition=be.visible)
@@ -443,7 +1049,7 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
 
     def hover(self):
         self._execute_on_webelement(
-            lambda it: self._actions_chains.move_to_element(it).perform(),
+            lambda it: self._actions().move_to_element(it).perform(),
             condition=be.visible)
         return self
 
@@ -471,11 +1077,26 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
 
     @property
     def text(self):
-        return self._execute_on_webelement(
-            lambda it: it.text,
-            condition=be.visible)
+        return self.get_text()
+
+    def get_text(self, strategy=None):
+        # type: (Optional[str]) -> str
+        """
+        Takes text by the strategy (config.text_strategy by default), see selene.text_strategies.TextStrategy,
+        waiting for the element to be visible for the rendered strategy, or to be in DOM for others
+        """
+        strategy = text_strategies.resolved(strategy)
+        if strategy == TextStrategy.RENDERED:
+            return self._execute_on_webelement(
+                lambda it: it.text,
+                condition=be.visible)
+        return _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage('Text by {}'.format(strategy), TEXT_OF_ELEMENT, strategy))
 
     def click(self):
+        if batching.recorded(self, 'click'):
+            return self
         self._execute_on_webelement(
             lambda it: it.click(),
             condition=be.visible)
@@ -488,6 +1109,8 @@ class SeleneElement(with_metaclass(DelegatingMeta, IWebElement)):
         return self
 
     def clear(self):
+        if batching.recorded(self, 'clear'):
+            return self
         self._execute_on_webelement(
             lambda it: it.clear(),
             condition=be.visible)
@@ -588,11 +1211,13 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
     But that's the place where we should be more restrictive.
     It is actually the Selenium, who should use "Sequence" instead of "MutableSequence" (list)
     """
+    __slots__ = ('_locator', '_webdriver')
 
     @property
     def __delegate__(self):
         # type: () -> List[IWebElement]
-        return self._locator.find()
+        batching.flush()
+        return interning.interned_all(self._locator.find())
 
     def get_actual_webelements(self):
         # type: () -> List[IWebElement]
@@ -602,6 +1227,14 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
         # type: () -> List[IWebElement]
         return self.__delegate__
 
+    def get_actual_size(self):
+        # type: () -> int
+        query = self._locator.page_query()
+        if query is None:
+            return len(self.get_actual_webelements())
+        batching.flush()
+        return query.count(self._webdriver)
+
     @classmethod
     def by(cls, by, webdriver, context=None):
         # type: (Tuple[str, str], IWebDriver, ISearchContext) -> SeleneCollection
@@ -637,8 +1270,7 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
 
     def _as_cached_list(self):  # todo: should we make it a property?
         # type: () -> Iterable[SeleneElement]
-        return [SeleneElement(WrappedWebElementLocator(webelement, '${this}[${index}]'.format(this=self, index=i)),
-                              self._webdriver)
+        return [SeleneElement(CachedIndexedWebElementLocator(webelement, i, self), self._webdriver)
                 for i, webelement in
                 enumerate(self.get_actual_webelements())]
 
@@ -652,6 +1284,17 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
         except Exception:
             return False
 
+    def count_now(self):
+        # type: () -> int
+        """
+        Counts elements once, without waiting for parents of the collection to appear (0 if they are absent)
+        """
+        try:
+            with resolution.probing():
+                return self.get_actual_size()
+        except (NoSuchElementException, TimeoutException):
+            return 0
+
     # *** Assertable ***
 
     # todo: consider extracting the following not DRY should methods to BaseMixin, or even better: some WaitObject
@@ -694,25 +1337,93 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
         return self.should_not(condition, timeout)
 
     def should_each(self, condition, timeout=None):
-        if timeout is None:
-            timeout = config.timeout
-
-        for selement in self:
-            selement.should(condition, timeout)
+        return self.should(each(condition), timeout)
 
     def assure_each(self, condition, timeout=None):
         return self.should_each(condition, timeout)
 
     def should_each_not(self, condition, timeout=None):
-        if timeout is None:
-            timeout = config.timeout
-
-        for selement in self:
-            selement.should_not(condition, timeout)
+        return self.should(each(not_(condition)), timeout)
 
     def assure_each_not(self, condition, timeout=None):
         return self.should_each_not(condition, timeout)
 
+    # *** Queries ***
+
+    def snapshots(self, *fields):
+        # type: (*str) -> List[Snapshot]
+        """
+        Takes snapshots of all elements by one execute_script call, see SeleneElement#snapshot for fields
+        """
+        values = _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage('Snapshots of {}'.format(fields), SNAPSHOTS_OF_ELEMENTS, list(fields)))
+        return [Snapshot(fields, element_values) for element_values in values]
+
+    def get_texts(self, strategy=None):
+        # type: (Optional[str]) -> List[str]
+        """
+        Takes texts of all elements by the strategy (config.text_strategy by default),
+        by one execute_script call for strategies other than the rendered one, see selene.text_strategies.TextStrategy
+        """
+        strategy = text_strategies.resolved(strategy)
+        if strategy == TextStrategy.RENDERED:
+            return [webelement.text for webelement in self.get_actual_webelements()]
+        return _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage('Texts by {}'.format(strategy), TEXTS_OF_ELEMENTS, strategy))
+
+    def prefetch_children(self, children):
+        # type: (Dict[str, object]) -> List[Dict[str, SeleneElement]]
+        """
+        Finds children of all elements (rows) of collection by one execute_script call, e.g.:
+            for row in ss('.item').prefetch_children({'name': '.name', 'qty': '.qty'}):
+                row['name'].should(have.exact_text('apple'))
+        Returns list of dicts of child names to elements, bound to the already found webelements.
+        Elements not found in advance or became stale are found lazily as by `collection[index].element(selector)`.
+        """
+        names = list(children)
+        bys = [css_or_by_to_by(children[name]) for name in names]
+        compiled = [compiled_by(by) for by in bys]
+        if None in compiled:
+            raise ValueError('child locator {} can not be resolved in the page'.format(bys[compiled.index(None)]))
+        grid = _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage(
+                'Prefetch of children {}'.format(names),
+                'return nodes.map(function (row) { return args[0].map(function (child) {'
+                ' return seleneFindFirst(row, child[0], child[1]); }); });',
+                [list(by) for by in compiled]))
+        return [{name: SeleneElement(
+                    PrefetchedWebElementLocator(webelement, InnerWebElementLocator(by, self[index])),
+                    self._webdriver)
+                 for name, by, webelement in zip(names, bys, row)}
+                for index, row in enumerate(grid)]
+
+    def extract(self, columns, as_numpy=False):
+        # type: (Dict[str, object], bool) -> Dict[str, List[object]]
+        """
+        Takes values of cells of all elements (rows) of collection by one execute_script call, e.g.:
+            ss('#orders tr').extract(columns={
+                'id': (None, 'data-id'),
+                'name': 'td.name',
+                'price': ('td.price', 'data-value')})
+        Each column is described by one of the following:
+            css/xpath selector or by of the cell inside the row - to take the text of the cell
+            (selector or by, field) - to take the field of the cell, see SeleneElement#snapshot for fields
+            (None, field) - to take the field of the row itself
+        Returns dict of column names to lists of values (None for the missing cells),
+        or numpy record array if as_numpy is True (requires numpy to be installed).
+        """
+        names = list(columns)
+        compiled = [_compiled_column(columns[name]) for name in names]
+        values = _wait_with_screenshot(
+            self._webdriver, self,
+            _ExecutedInPage('Extraction of {}'.format(names), EXTRACT_OF_ELEMENTS, compiled))
+        if as_numpy:
+            return as_numpy_records(names, values)
+        return dict(zip(names, values))
+
     def filtered_by(self, condition):
         return SeleneCollection(FilteredListWebElementLocator(condition, self), self._webdriver)
 
@@ -764,10 +1475,7 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
         return SeleneElement(IndexedWebElementLocator(index, collection=self), self._webdriver)
 
     def __len__(self):
-        # todo: optimise to the following:
-        #   return self.waifFor(size_at_least(0)),
-        # where waitFor will return the result of condition application, not self like should
-        return len(_wait_with_screenshot(self._webdriver, self, have.size_at_least(0)))
+        return _wait_with_screenshot(self._webdriver, self, have.size_at_least(0))
 
     # *** Overriden Sequence methods ***
 
@@ -781,6 +1489,89 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
 
     # *** Additional Collection style methods ***
 
+    def stream(self, chunk_size=100):
+        # type: (int) -> Iterable[SeleneElement]
+        """
+        Lazily yields elements of collection, found in the page by chunks of chunk_size elements,
+        so huge collections are never transferred from the page at once, e.g.:
+            for row in ss('tr').stream(chunk_size=500):
+                ...
+        Like get_actual_webelements, does not wait for elements to appear.
+        Yields all elements at once if the collection locator can't be resolved in the page.
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size should be positive, but was {}'.format(chunk_size))
+        return self._streamed(chunk_size)
+
+    def _streamed(self, chunk_size):
+        # type: (int) -> Iterable[SeleneElement]
+        query = self._locator.page_query()
+        if query is None:
+            for element in self._as_cached_list():
+                yield element
+            return
+        start = 0
+        while True:
+            chunk = interning.interned_all(
+                query.slice(slice(start, start + chunk_size)).find_all(self._webdriver))
+            for index, webelement in enumerate(chunk, start):
+                yield SeleneElement(CachedIndexedWebElementLocator(webelement, index, self), self._webdriver)
+            if len(chunk) < chunk_size:
+                return
+            start += chunk_size
+
+    def scroll_stream(self, container, key='text', fields=None, quiet=0.1):
+        # type: (object, str, Optional[Iterable[str]], float) -> Iterable[Union[SeleneElement, Snapshot]]
+        """
+        Lazily yields elements of virtualized or infinitely scrolled list, rendered while the container is scrolled,
+        or their snapshots if fields are given, skipping elements with already seen value of the key field, e.g.:
+            for row in ss('.grid .row').scroll_stream('.grid', key='data-id', fields=('data-id', 'text')):
+                ...
+        Each step scrolls the container by its height, waits until there are no mutations inside it for `quiet`
+        seconds (but not longer than config.timeout, even if the session script timeout is shorter)
+        and takes all rendered elements by one execute_async_script call.
+        Stops when the container can't be scrolled further or its end is reached, and no new elements were rendered.
+        key and fields are snapshot fields, see SeleneElement#snapshot.
+        Yielded elements are bound to the found webelements, that the list may reuse for other rows later.
+        """
+        if not isinstance(container, SeleneElement):
+            container = SeleneElement.by_css_or_by(container, self._webdriver)
+        scrollable = container._execute_on_webelement(lambda it: it, condition=be.in_dom)
+        fields = list(fields) if fields is not None else None
+        seen = set()
+        scroll = False
+        while True:
+            step = _wait_with_screenshot(
+                self._webdriver, self,
+                _ExecutedInPage(
+                    'Scroll step of {}'.format(container), SCROLL_STEP_OF_ELEMENTS,
+                    scrollable, scroll, key, fields, int(quiet * 1000), int(config.timeout * 1000),
+                    asynchronous=True, timeout=config.timeout))
+            rendered = 0
+            for value, row in step['rows']:
+                if value in seen:
+                    continue
+                seen.add(value)
+                rendered += 1
+                yield Snapshot(fields, row) if fields is not None else SeleneElement(
+                    WrappedWebElementLocator(row, '{}.scrolled_to({}={!r})'.format(self, key, value)),
+                    self._webdriver)
+            if not rendered and (step['end'] or not step['moved']):
+                return
+            scroll = True
+
+    def watch(self, fields=None, timeout=None):
+        # type: (Optional[Iterable[str]], Optional[int]) -> CollectionWatcher
+        """
+        Starts recording elements added to and removed from the collection in the page, e.g.:
+            with ss('#chat .message').watch(fields=('text',)) as messages:
+                s('#send').click()
+                for kind, message in messages:
+                    ...
+        See CollectionWatcher. Requires the collection locator to be resolved in the page.
+        """
+        return CollectionWatcher(self, fields, timeout)
+
     # *** Useful shortcuts ***
 
     def size(self):
@@ -788,3 +1579,147 @@ class SeleneCollection(with_metaclass(DelegatingMeta, Sequence)):
 
     def first(self):
         return self[0]
+
+
+class CollectionWatcher(object):
+    """
+    Changes of the collection, recorded in the page by MutationObserver of the collection containers
+    (parents the collection elements are searched in, or the document), and drained by one execute_async_script
+    call per batch. Each change is a tuple (CollectionWatcher.ADDED or CollectionWatcher.REMOVED, element),
+    where element is the SeleneElement bound to the found webelement (stale for removed ones),
+    or its Snapshot of fields, taken when it was added (or when the watch started).
+    Iteration yields changes as they happen and stops when there were no changes for timeout seconds
+    (config.timeout by default).
+    """
+    ADDED = 'added'
+    REMOVED = 'removed'
+
+    __slots__ = ('_collection', '_query', '_fields', '_timeout', '_id')
+
+    def __init__(self, collection, fields=None, timeout=None):
+        # type: (SeleneCollection, Optional[Iterable[str]], Optional[int]) -> None
+        self._collection = collection
+        self._query = collection._locator.page_query()
+        if self._query is None:
+            raise ValueError('collection {} can not be watched, because its locator can not be resolved in the page'
+                             .format(collection))
+        self._fields = list(fields) if fields is not None else None
+        self._timeout = timeout if timeout is not None else config.timeout
+        self._id = uuid.uuid4().hex
+        _wait_with_screenshot(
+            collection._webdriver, collection,
+            _ExecutedInPage('Watch of changes', WATCH_ELEMENTS, self._id, self._fields, asynchronous=True))
+
+    def _changes(self, changes):
+        for kind, found in changes:
+            if self._fields is not None:
+                yield kind, Snapshot(self._fields, found)
+            else:
+                yield kind, SeleneElement(
+                    WrappedWebElementLocator(found, '{}.{}'.format(self._collection, kind)),
+                    self._collection._webdriver)
+
+    def drain(self, timeout=0):
+        # type: (float) -> List[Tuple[str, Union[SeleneElement, Snapshot]]]
+        """
+        Returns changes recorded since the previous drain, waiting for them at most timeout seconds
+        (even if the session script timeout is shorter)
+        """
+        changes = self._query.execute_async(
+            self._collection._webdriver, DRAIN_WATCHED, self._id, int(timeout * 1000), timeout=timeout)
+        if changes is None:
+            raise NoSuchElementException(
+                'watch of {} was stopped or lost with the page it was started in'.format(self._collection))
+        return list(self._changes(changes))
+
+    def __iter__(self):
+        while True:
+            changes = self.drain(self._timeout)
+            if not changes:
+                return
+            for change in changes:
+                yield change
+
+    def stop(self):
+        self._query.execute_async(self._collection._webdriver, STOP_WATCHING, self._id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+# exceptions raised for kinds of failures, that options of select can't be selected at all, see _SELECT
+_SELECTION_ERRORS = {
+    'tag': UnexpectedTagNameException,
+    'missing': NoSuchElementException,
+    'multiple': NotImplementedError,
+}
+
+
+class SeleneSelect(object):
+    """
+    Native <select> element, which options are selected and taken in the page, without clicking them
+    """
+    __slots__ = ('_element',)
+
+    def __init__(self, element):
+        # type: (SeleneElement) -> None
+        self._element = element
+
+    def __str__(self):
+        return str(self._element)
+
+    def select(self, value=None, text=None):
+        # type: (Union[object, List[object], None], Union[object, List[object], None]) -> SeleneSelect
+        """
+        Selects the option with the value or the (stripped) text, or options with values or texts of the list
+        for multiple selects, deselecting others, by one execute_script call.
+        Waits for the select to be visible and enabled, and for the options to be enabled, but fails at once
+        if the options are absent (NoSuchElementException), or the select does not allow multiple options
+        (NotImplementedError), or the element is not a select (UnexpectedTagNameException).
+        """
+        if (value is None) == (text is None):
+            raise ValueError('either value or text should be specified')
+        values, by = (value, 'value') if value is not None else (text, 'text')
+        values = list(values) if isinstance(values, (list, tuple)) else [values]
+        self._selected('Select by {} {}'.format(by, values), values, by)
+        return self
+
+    def deselect_all(self):
+        # type: () -> SeleneSelect
+        """
+        Deselects all options of the multiple select, like Select#deselect_all of selenium
+        """
+        if not self._element.get_attribute('multiple'):
+            raise NotImplementedError('You may only deselect all options of a multi-select')
+        self._selected('Deselect all', [], 'value')
+        return self
+
+    def _selected(self, description, values, by):
+        """
+        selects options, waiting until they can be selected, but failing at once if they can't be selected at all
+        """
+        error = _wait_with_screenshot(
+            self._element._webdriver, self._element, _PerformedInPage(description, _SELECT, values, by))
+        if error is not None:
+            kind, reason = error
+            raise _SELECTION_ERRORS[kind]('{} failed for {}: {}'.format(description, self._element, reason))
+
+    def options(self, *fields):
+        # type: (*str) -> List[Snapshot]
+        """
+        Takes snapshots of all options by one execute_script call,
+        of fields 'value', 'text' and 'selected' by default (see SeleneElement#snapshot for fields)
+        """
+        fields = fields or ('value', 'text', 'selected')
+        values = _wait_with_screenshot(
+            self._element._webdriver, self._element,
+            _ExecutedInPage('Options of {}'.format(fields), OPTIONS_OF_SELECT, list(fields)))
+        return [Snapshot(fields, option_values) for option_values in values]
+
+    def selected_options(self, *fields):
+        # type: (*str) -> List[Snapshot]
+        fields = tuple(fields or ('value', 'text')) + ('selected',)
+        return [option for option in self.options(*fields) if option.selected]
@@ -20,11 +20,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import os
+
 SELENE_TIMEOUT = "selene_timeout"
 SELENE_POLL_DURING_WAITS = 'selene_poll_during_waits'
 SELENE_BASE_URL = 'selene_base_url'
 SELENE_CACHE_ELEMENTS = 'selene_cache_elements'
+SELENE_INTERN_ELEMENTS = 'selene_intern_elements'
+SELENE_STALE_ELEMENT_RETRIES = 'selene_stale_element_retries'
+SELENE_TEXT_STRATEGY = 'selene_text_strategy'
+SELENE_FAST_SET_VALUE = 'selene_fast_set_value'
 SELENE_BROWSER_NAME = 'selene_browser_name'
 SELENE_START_MAXIMIZED = 'selene_start_maximized'
 SELENE_HOLD_BROWSER_OPEN = 'selene_hold_browser_open'
 SELENE_REPORTS_FOLDER = 'selene_reports_folder'
+
+
+def env(key, default=None):
+    try:
+        return os.environ.get(key, default)
+    except KeyError:
+        return None
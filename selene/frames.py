@@ -0,0 +1,113 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Switching to frames of framed elements (see SeleneDriver#frame), with the frame switched to the last time
+remembered per webdriver session, so consecutive lookups in the same frame don't switch frames again.
+Frames are switched to by paths of frame element locators, from the top level document to the innermost frame.
+If frames are switched manually, call forget(webdriver) to let selene switch frames from the top level next time.
+Searches relying on the remembered frame are retried from the top level once if the frame is gone (see within).
+Other commands (like SeleneDriver#execute_script, that may get framed elements as arguments) are executed
+in the frame switched to the last time, call leave(webdriver) to execute them in the top level document.
+"""
+import weakref
+
+from selenium.common.exceptions import NoSuchElementException, NoSuchFrameException, NoSuchWindowException, \
+    StaleElementReferenceException
+
+# webdriver -> path of frames switched to the last time by selene (top level if never switched), None if unknown
+_current = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def unwrapped(webdriver):
+    """
+    returns the actual webdriver of selene driver (which delegates to it), to execute commands in the current frame
+    """
+    return webdriver.__delegate__ if hasattr(type(webdriver), '__delegate__') else webdriver
+
+
+def switch_to(webdriver, path):
+    # type: (IWebDriver, Tuple[Tuple[str, str], ...]) -> None
+    """
+    switches to the innermost frame of path (to the top level document for the empty path),
+    if the webdriver is not switched to it yet
+    """
+    raw = unwrapped(webdriver)
+    current = _current.get(raw, ())
+    if current == path:
+        return
+    _current[raw] = None
+    if current is not None and path[:len(current)] == current:
+        switched, remaining = current, path[len(current):]
+    else:
+        switched, remaining = (), path
+        raw.switch_to.default_content()
+    for by in remaining:
+        raw.switch_to.frame(raw.find_element(*by))
+        switched += (by,)
+    _current[raw] = switched
+
+
+def within(webdriver, path, command):
+    """
+    calls command() switched to the innermost frame of path; if it relied on the remembered frame, and either
+    switching to the rest of path failed, or the command failed as the remembered frame is gone (re-rendered,
+    or the window is switched), forgets the frame and calls command() once again, switched to the frame
+    from the top level document; elements missing in the frame fail the command at once
+    """
+    raw = unwrapped(webdriver)
+    current = _current.get(raw, ())
+    remembered = bool(current) and path[:len(current)] == current
+    try:
+        switch_to(webdriver, path)
+        return command()
+    except (NoSuchElementException, NoSuchFrameException, NoSuchWindowException,
+            StaleElementReferenceException) as error:
+        switched = _current.get(raw) == path
+        if not remembered or (switched and isinstance(error, NoSuchElementException)):
+            raise
+        forget(webdriver)
+        switch_to(webdriver, path)
+        return command()
+
+
+def leave(webdriver):
+    """
+    switches back to the top level document if selene switched to some frame,
+    so the next commands of the page (like execute_script) are not executed in the frame of elements found last
+    """
+    if _current.get(unwrapped(webdriver), ()):
+        switch_to(webdriver, ())
+
+
+def forget(webdriver):
+    """
+    lets selene switch frames from the top level document on the next lookup in any frame
+    """
+    _current[unwrapped(webdriver)] = None
+
+
+def reset(webdriver):
+    """
+    marks the webdriver as switched to the top level document (e.g. after opening new page)
+    """
+    _current[unwrapped(webdriver)] = ()
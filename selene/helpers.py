@@ -26,6 +26,7 @@ import os
 from selenium.webdriver.common.by import By
 
 import selene.config
+from selene.environment import env  # was defined here, is still importable from here
 
 
 @contextlib.contextmanager
@@ -80,10 +81,3 @@ def css_or_by_to_by(selector_or_by):
         return (By.XPATH, selector_or_by) if (selector_or_by.startswith('/') or selector_or_by.startswith('./')) \
             else (By.CSS_SELECTOR, selector_or_by)
     raise TypeError('selector_or_by should be str with CSS selector or XPATH selector or Tuple[by:str, value:str]')
-
-
-def env(key, default=None):
-    try:
-        return os.environ.get(key, default)
-    except KeyError:
-        return None
@@ -0,0 +1,63 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Opt-in interning of found webelements by their ids, see `config.intern_elements`.
+The same DOM node found again in the same session is represented by the same webelement object,
+so it can be compared or deduplicated by identity without extra webdriver calls.
+"""
+import weakref
+
+from selene import config
+
+# webdriver (session) -> {element id -> webelement}, both are weak,
+# so tables of closed sessions and entries of webelements not referenced anymore are dropped
+_tables = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def _table_of(webdriver):
+    table = _tables.get(webdriver)
+    if table is None:
+        table = _tables[webdriver] = weakref.WeakValueDictionary()
+    return table
+
+
+def interned(webelement):
+    # type: (IWebElement) -> IWebElement
+    """
+    returns the webelement already seen in the session for the same element id, or the webelement itself
+    """
+    if not config.intern_elements:
+        return webelement
+    try:
+        table = _table_of(webelement.parent)
+        return table.setdefault(webelement.id, webelement)
+    except (AttributeError, TypeError):
+        # not a remote webelement (e.g. a wrapper or a stub), nothing to intern by
+        return webelement
+
+
+def interned_all(webelements):
+    # type: (List[IWebElement]) -> List[IWebElement]
+    if not config.intern_elements:
+        return webelements
+    return [interned(webelement) for webelement in webelements]
@@ -0,0 +1,710 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import re
+import weakref
+from functools import lru_cache
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from selene import frames
+
+# *** In-page runtime ***
+#
+# Each query is passed to the page as a list of steps (arguments[0]) and a root WebElement or list of them
+# (arguments[1]), that is null in case of the document root.
+# Scripts return [true, result] on success or [false] if some element of the chain was not found.
+
+_LIBRARY = r'''
+function seleneFindAll(context, using, value) {
+    if (using === 'selene relative') {
+        return seleneFindRelative(context, JSON.parse(value));
+    }
+    if (using === 'selene shadow') {
+        return seleneFindInShadow(context, value);
+    }
+    if (using === 'xpath') {
+        var snapshot = (context.ownerDocument || context).evaluate(
+            value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var found = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            found.push(snapshot.snapshotItem(i));
+        }
+        return found;
+    }
+    return Array.prototype.slice.call(context.querySelectorAll(value));
+}
+
+function seleneFindFirst(context, using, value) {
+    if (using.indexOf('selene ') === 0) {
+        return seleneFindAll(context, using, value)[0] || null;
+    }
+    if (using === 'xpath') {
+        return (context.ownerDocument || context).evaluate(
+            value, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return context.querySelector(value);
+}
+
+// elements found by css selectors path like 'my-app >>> my-input >>> input',
+// where each next selector after >>> is searched inside open shadow roots of elements found by the previous one,
+// the path starting with >>> is searched inside the shadow root of the context
+function seleneFindInShadow(context, path) {
+    var selectors = path.split('>>>');
+    var first = selectors[0].trim();
+    var found = first ? Array.prototype.slice.call(context.querySelectorAll(first)) : [context];
+    for (var i = 1; i < selectors.length; i++) {
+        var selector = selectors[i].trim();
+        var inner = [];
+        for (var j = 0; j < found.length; j++) {
+            if (found[j].shadowRoot) {
+                inner = inner.concat(Array.prototype.slice.call(found[j].shadowRoot.querySelectorAll(selector)));
+            }
+        }
+        found = inner;
+    }
+    return found;
+}
+
+// elements found by spec.candidates locator, placed in spec.direction relative to the first element found by
+// spec.anchor locator (both are searched in the context), sorted by distance between centers to the anchor,
+// except the anchor, its ancestors and descendants (that overlap it)
+function seleneFindRelative(context, spec) {
+    var anchor = seleneFindFirst(context, spec.anchor[0], spec.anchor[1]);
+    if (!anchor) {
+        return [];
+    }
+    var a = anchor.getBoundingClientRect();
+    var placed = {
+        above: function (r) { return r.bottom <= a.top; },
+        below: function (r) { return r.top >= a.bottom; },
+        left_of: function (r) { return r.right <= a.left; },
+        right_of: function (r) { return r.left >= a.right; },
+        near: function (r) {
+            var dx = Math.max(a.left - r.right, r.left - a.right, 0);
+            var dy = Math.max(a.top - r.bottom, r.top - a.bottom, 0);
+            return Math.sqrt(dx * dx + dy * dy) <= spec.distance;
+        }
+    }[spec.direction];
+    return seleneFindAll(context, spec.candidates[0], spec.candidates[1])
+        .filter(function (element) { return !element.contains(anchor) && !anchor.contains(element); })
+        .map(function (element) { return [element, element.getBoundingClientRect()]; })
+        .filter(function (found) { return (found[1].width > 0 || found[1].height > 0) && placed(found[1]); })
+        .map(function (found) {
+            var r = found[1];
+            var dx = (r.left + r.width / 2) - (a.left + a.width / 2);
+            var dy = (r.top + r.height / 2) - (a.top + a.height / 2);
+            return [found[0], dx * dx + dy * dy];
+        })
+        .sort(function (one, other) { return one[1] - other[1]; })
+        .map(function (found) { return found[0]; });
+}
+
+function seleneCountAll(context, using, value) {
+    if (using.indexOf('selene ') === 0) {
+        return seleneFindAll(context, using, value).length;
+    }
+    if (using === 'xpath') {
+        return (context.ownerDocument || context).evaluate(
+            value, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    }
+    return context.querySelectorAll(value).length;
+}
+
+function seleneResolve(steps, root, upTo) {
+    var nodes = root === null || root === undefined ? [document] : [].concat(root);
+    for (var i = 0; i < upTo; i++) {
+        var step = steps[i];
+        if (step[0] === 'all') {
+            var found = [];
+            for (var j = 0; j < nodes.length; j++) {
+                found = found.concat(seleneFindAll(nodes[j], step[1], step[2]));
+            }
+            nodes = found;
+        } else if (step[0] === 'index') {
+            var index = step[1] < 0 ? nodes.length + step[1] : step[1];
+            if (index < 0 || index >= nodes.length) {
+                return null;
+            }
+            nodes = [nodes[index]];
+        } else if (step[0] === 'slice') {
+            nodes = seleneSlice(nodes, step[1], step[2], step[3]);
+        }
+    }
+    return nodes;
+}
+
+// bounds of the slice are normalized the same way as python's slice.indices(length) does
+function seleneSliceBound(bound, length, step, isStart) {
+    if (bound === null) {
+        return step > 0 ? (isStart ? 0 : length) : (isStart ? length - 1 : -1);
+    }
+    if (bound < 0) {
+        bound += length;
+    }
+    return step > 0 ? Math.min(Math.max(bound, 0), length) : Math.min(Math.max(bound, -1), length - 1);
+}
+
+function seleneSlice(nodes, start, stop, step) {
+    step = step === null ? 1 : step;
+    var from = seleneSliceBound(start, nodes.length, step, true);
+    var to = seleneSliceBound(stop, nodes.length, step, false);
+    var sliced = [];
+    for (var i = from; step > 0 ? i < to : i > to; i += step) {
+        sliced.push(nodes[i]);
+    }
+    return sliced;
+}
+
+function seleneCount(steps, root) {
+    var last = steps[steps.length - 1];
+    if (!last || last[0] !== 'all') {
+        var nodes = seleneResolve(steps, root, steps.length);
+        return nodes === null ? null : nodes.length;
+    }
+    var contexts = seleneResolve(steps, root, steps.length - 1);
+    if (contexts === null) {
+        return null;
+    }
+    var count = 0;
+    for (var i = 0; i < contexts.length; i++) {
+        count += seleneCountAll(contexts[i], last[1], last[2]);
+    }
+    return count;
+}
+
+var SELENE_BOOLEAN_ATTRIBUTES = [
+    'allowfullscreen', 'async', 'autofocus', 'autoplay', 'checked', 'compact', 'complete', 'controls',
+    'declare', 'default', 'defaultchecked', 'defaultselected', 'defer', 'disabled', 'draggable', 'ended',
+    'formnovalidate', 'hidden', 'indeterminate', 'iscontenteditable', 'ismap', 'itemscope', 'loop',
+    'multiple', 'muted', 'nohref', 'noresize', 'noshade', 'novalidate', 'nowrap', 'open', 'paused',
+    'pubdate', 'readonly', 'required', 'reversed', 'scoped', 'seamless', 'seeking', 'selected',
+    'spellcheck', 'truespeed', 'willvalidate'];
+
+function seleneAttribute(element, name) {
+    name = name.toLowerCase();
+    var tag = element.tagName.toLowerCase();
+    if (name === 'style') {
+        return element.style.cssText;
+    }
+    if ((name === 'selected' || name === 'checked')
+            && (tag === 'option' || (tag === 'input' && /^(checkbox|radio)$/i.test(element.type)))) {
+        return (tag === 'option' ? element.selected : element.checked) ? 'true' : null;
+    }
+    if ((tag === 'img' && name === 'src') || (tag === 'a' && name === 'href')) {
+        return element.getAttribute(name) ? element[name] : element.getAttribute(name);
+    }
+    var property = {'class': 'className', 'readonly': 'readOnly'}[name] || name;
+    if (SELENE_BOOLEAN_ATTRIBUTES.indexOf(name) >= 0) {
+        return element.getAttribute(name) || element[property] ? 'true' : null;
+    }
+    var value = element[property];
+    if (value === undefined || value === null || typeof value === 'object') {
+        value = element.getAttribute(name);
+    }
+    return value === undefined || value === null ? null : String(value);
+}
+
+function seleneParent(element) {
+    var parent = element.parentNode;
+    return parent && parent.nodeType === 11 ? parent.host : parent;
+}
+
+function seleneHasPositiveSize(element) {
+    var rect = element.getBoundingClientRect();
+    if (rect.width > 0 && rect.height > 0) {
+        return true;
+    }
+    if (window.getComputedStyle(element).overflow === 'hidden') {
+        return false;
+    }
+    return Array.prototype.some.call(element.childNodes, function (child) {
+        return child.nodeType === 3 || (child.nodeType === 1 && seleneHasPositiveSize(child));
+    });
+}
+
+// results of the check for ancestors, that are shared by all elements checked in one script call
+// (the page can't change during the call)
+var seleneRenderedCache = new Map();
+
+function seleneIsRendered(element) {
+    if (!element || element.nodeType !== 1) {
+        return true;
+    }
+    if (seleneRenderedCache.has(element)) {
+        return seleneRenderedCache.get(element);
+    }
+    var style = window.getComputedStyle(element);
+    var rendered = style.display !== 'none' && parseFloat(style.opacity) !== 0
+        && seleneIsRendered(seleneParent(element));
+    seleneRenderedCache.set(element, rendered);
+    return rendered;
+}
+
+function seleneIsDisplayed(element) {
+    var tag = element.tagName.toLowerCase();
+    if (tag === 'body' || tag === 'html') {
+        return true;
+    }
+    if (tag === 'option' || tag === 'optgroup') {
+        var select = element.closest('select, datalist');
+        return select ? seleneIsDisplayed(select) : true;
+    }
+    if ((tag === 'input' && element.type.toLowerCase() === 'hidden') || tag === 'noscript') {
+        return false;
+    }
+    var style = window.getComputedStyle(element);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') {
+        return false;
+    }
+    if (!seleneIsRendered(element)) {
+        return false;
+    }
+    return seleneHasPositiveSize(element);
+}
+
+function seleneIsEnabled(element) {
+    var tag = element.tagName.toLowerCase();
+    if (['button', 'input', 'optgroup', 'option', 'select', 'textarea'].indexOf(tag) < 0) {
+        return true;
+    }
+    if (element.disabled) {
+        return false;
+    }
+    if ((tag === 'option' || tag === 'optgroup') && element.parentNode && element.parentNode.nodeType === 1) {
+        return seleneIsEnabled(element.parentNode);
+    }
+    for (var current = element; current.parentElement; current = current.parentElement) {
+        var parent = current.parentElement;
+        if (parent.tagName.toLowerCase() === 'fieldset' && parent.disabled
+                && !(current.tagName.toLowerCase() === 'legend' && parent.querySelector('legend') === current)) {
+            return false;
+        }
+    }
+    return true;
+}
+
+function seleneIsSelected(element) {
+    var tag = element.tagName.toLowerCase();
+    if (tag === 'option') {
+        return element.selected;
+    }
+    return tag === 'input' && /^(checkbox|radio)$/i.test(element.type) && element.checked;
+}
+
+function seleneRenderedText(element) {
+    if (!seleneIsDisplayed(element)) {
+        return '';
+    }
+    var text = element.innerText === undefined ? element.textContent : element.innerText;
+    return text
+        .replace(/\u00a0/g, ' ')
+        .split('\n')
+        .map(function (line) { return line.replace(/^[ \t\r]+|[ \t\r]+$/g, ''); })
+        .join('\n')
+        .replace(/^\n+|\n+$/g, '');
+}
+
+// text of the element by the strategy of selene.text_strategies.TextStrategy
+function seleneText(element, strategy) {
+    if (strategy === 'renderedInPage') {
+        return seleneRenderedText(element);
+    }
+    if (strategy === 'innerText') {
+        return element.innerText === undefined ? element.textContent : element.innerText;
+    }
+    if (strategy === 'normalized') {
+        return element.textContent.replace(/\s+/g, ' ').replace(/^ | $/g, '');
+    }
+    return element.textContent;
+}
+
+// calls callback when there were no mutations inside target for quietMs milliseconds, but not later than in maxMs
+function seleneWhenQuiet(target, quietMs, maxMs, callback) {
+    var started = Date.now();
+    var timer = null;
+    var finished = false;
+    var observer = new MutationObserver(restart);
+    function finish() {
+        if (!finished) {
+            finished = true;
+            observer.disconnect();
+            clearTimeout(timer);
+            callback();
+        }
+    }
+    function restart() {
+        clearTimeout(timer);
+        timer = setTimeout(finish, Math.max(0, Math.min(quietMs, maxMs - (Date.now() - started))));
+    }
+    observer.observe(target, {childList: true, subtree: true, characterData: true, attributes: true});
+    restart();
+}
+
+// sets the value by the native setter of the element prototype (bypassing value trackers of frameworks like React)
+// and dispatches input and change events, as if the value was typed
+function seleneSetValue(element, value) {
+    var descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+    if (descriptor && descriptor.set) {
+        descriptor.set.call(element, value);
+    } else {
+        element.value = value;
+    }
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+}
+
+function seleneOptionMatches(option, value, by) {
+    return (by !== 'text' && option.value === value) || (by !== 'value' && option.text.trim() === value);
+}
+
+// returns [kind, reason] if options of the select can't be selected by values at all:
+// kind is 'missing' if some options are absent, or 'multiple' if the select does not allow multiple options, or null
+function seleneSelectionError(select, values, by) {
+    var options = Array.prototype.slice.call(select.options);
+    var wanted = [].concat(values).map(String);
+    var missing = wanted.filter(function (value) {
+        return !options.some(function (option) { return seleneOptionMatches(option, value, by); });
+    });
+    if (missing.length) {
+        return ['missing', 'no options with ' + (by === 'any' ? 'value or text' : by) + ': ' + missing.join(', ')];
+    }
+    if (wanted.length > 1 && !select.multiple) {
+        return ['multiple', 'select does not allow multiple options'];
+    }
+    return null;
+}
+
+// selects options of the select, which values or texts (by is 'value', 'text' or 'any') are in values,
+// deselecting others, and dispatches input and change events if the selection changed,
+// returns the reason of the failure or null
+function seleneSelectOptions(select, values, by) {
+    var error = seleneSelectionError(select, values, by);
+    if (error !== null) {
+        return error[1];
+    }
+    var options = Array.prototype.slice.call(select.options);
+    var wanted = [].concat(values).map(String);
+    var disabled = options.filter(function (option) {
+        return option.disabled && !option.selected
+            && wanted.some(function (value) { return seleneOptionMatches(option, value, by); });
+    });
+    if (disabled.length) {
+        return 'options are disabled: ' + disabled.map(function (option) { return option.text.trim(); }).join(', ');
+    }
+    var changed = false;
+    options.forEach(function (option) {
+        var selected = wanted.some(function (value) { return seleneOptionMatches(option, value, by); });
+        if (option.selected !== selected) {
+            option.selected = selected;
+            changed = true;
+        }
+    });
+    if (changed) {
+        select.dispatchEvent(new Event('input', {bubbles: true}));
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return null;
+}
+
+function seleneCssValue(element, name) {
+    var value = window.getComputedStyle(element).getPropertyValue(name);
+    return value.replace(/rgb\((\d+), (\d+), (\d+)\)/g, 'rgba($1, $2, $3, 1)');
+}
+'''
+
+
+# The library is installed in the document once (as a function returning the library functions, so that their state,
+# like seleneRenderedCache, lives during one script call only), and each script takes from it the functions it uses.
+# Scripts return _NOT_INSTALLED if the library is not installed yet, e.g. in the new document after navigation.
+_LIBRARY_NAMES = tuple(re.findall(r'^(?:function|var) (\w+)', _LIBRARY, re.MULTILINE))
+
+_INSTALLED = 'seleneLibrary_' + hashlib.sha1(_LIBRARY.encode('utf-8')).hexdigest()[:8]
+
+_INSTALL = 'window.%s = function () {\n%s\nreturn {%s};\n};' % (
+    _INSTALLED, _LIBRARY, ', '.join('%s: %s' % (name, name) for name in _LIBRARY_NAMES))
+
+_NOT_INSTALLED = 'selene library is not installed'
+
+
+@lru_cache(maxsize=256)
+def _with_library(script, asynchronous=False):
+    used = [name for name in _LIBRARY_NAMES if re.search(r'\b%s\b' % name, script)]
+    if not used:
+        return script
+    not_installed = "arguments[arguments.length - 1]('%s'); return;" if asynchronous else "return '%s';"
+    return '\n'.join([
+        'if (!window.%s) { %s }' % (_INSTALLED, not_installed % _NOT_INSTALLED),
+        'var seleneLibrary = window.%s();' % _INSTALLED,
+        'var %s;' % ', '.join('%s = seleneLibrary.%s' % (name, name) for name in used),
+        script])
+
+
+# The session script timeout (in seconds) bounds execute_async_script calls, so asynchronous scripts waiting longer
+# are executed with the timeout set to their own one, and then restored to the one set by remember_script_timeout.
+# The timeout can't be taken from the session, so the W3C default is restored if it was not set through selene.
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# how long the script may be executed after its own timeout, to finish with the result
+_SCRIPT_TIMEOUT_MARGIN = 1
+
+# webdriver -> session script timeout set through selene
+_script_timeouts = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def remember_script_timeout(webdriver, timeout):
+    """
+    remembers the session script timeout set for the webdriver (e.g. by SeleneDriver#set_script_timeout),
+    to restore it after asynchronous scripts executed with their own timeouts
+    """
+    _script_timeouts[frames.unwrapped(webdriver)] = timeout
+
+
+def _with_script_timeout(webdriver, timeout, command):
+    webdriver.set_script_timeout(timeout + _SCRIPT_TIMEOUT_MARGIN)
+    try:
+        return command()
+    finally:
+        webdriver.set_script_timeout(_script_timeouts.get(webdriver, DEFAULT_SCRIPT_TIMEOUT))
+
+
+def _execute(webdriver, script, *args, asynchronous=False):
+    """executes the script using the library, installing it in the document if needed"""
+    execute = webdriver.execute_async_script if asynchronous else webdriver.execute_script
+    script = _with_library(script, asynchronous)
+    result = execute(script, *args)
+    if result == _NOT_INSTALLED:
+        webdriver.execute_script(_INSTALL)
+        result = execute(script, *args)
+    return result
+
+
+_COUNT = '''
+var count = seleneCount(arguments[0], arguments[1]);
+return count === null ? [false] : [true, count];
+'''
+
+_EXECUTE_HEAD = '''
+var nodes = seleneResolve(arguments[0], arguments[1], arguments[0].length);
+if (nodes === null) {
+    return [false];
+}
+var args = Array.prototype.slice.call(arguments, 2);
+return [true, (function (nodes, args) {
+'''
+
+_EXECUTE_TAIL = '''
+})(nodes, args)];
+'''
+
+_EXECUTE_ASYNC_HEAD = '''
+var steps = arguments[0], root = arguments[1], callback = arguments[arguments.length - 1];
+var args = Array.prototype.slice.call(arguments, 2, arguments.length - 1);
+(function (resolve, args, done, notFound, steps) {
+'''
+
+_EXECUTE_ASYNC_TAIL = '''
+})(function (upTo) { return seleneResolve(steps, root, upTo === undefined ? steps.length : upTo); },
+   args,
+   function (result) { callback([true, result]); },
+   function () { callback([false]); },
+   steps);
+'''
+
+
+_EXECUTE_ALL_HEAD = '''
+var args = Array.prototype.slice.call(arguments, 1);
+return (function (chains, args) {
+'''
+
+_EXECUTE_ALL_TAIL = '''
+})(arguments[0], args);
+'''
+
+
+# locator strategies, that are supported only in the page, see selene.bys.by_relative and selene.bys.by_shadow
+RELATIVE = 'selene relative'
+SHADOW = 'selene shadow'
+IN_PAGE_STRATEGIES = frozenset([RELATIVE, SHADOW])
+
+
+def compiled_by(by):
+    """
+    converts selenium locator to the form supported in page, the same way as w3c selenium does,
+    returns None if the locator strategy can't be resolved in the page
+    """
+    using, value = by
+    if using in (By.CSS_SELECTOR, By.XPATH) or using in IN_PAGE_STRATEGIES:
+        return using, value
+    if using == By.ID:
+        return By.CSS_SELECTOR, '[id="%s"]' % value
+    if using == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    if using == By.CLASS_NAME:
+        return By.CSS_SELECTOR, '.%s' % value
+    if using == By.NAME:
+        return By.CSS_SELECTOR, '[name="%s"]' % value
+    return None
+
+
+class PageQuery(object):
+    """
+    Locator chain that is resolved in the page by one execute_script call.
+    The chain starts from the document or from a WebElement and consists of the following steps:
+        ['all', using, value] - all elements found inside each current element by css selector or xpath
+        ['index', index] - current element by index, negative indexes are counted from the end
+        ['slice', start, stop, step] - current elements sliced like python list, bounds may be None or negative
+    """
+
+    @classmethod
+    def of_document(cls, frame=None):
+        """
+        frame is the path of frame locators to switch to before the execution, None to stay in the current frame
+        """
+        return PageQuery(frame=frame)
+
+    @classmethod
+    def of_webelement(cls, webelement):
+        return PageQuery(root=webelement)
+
+    @classmethod
+    def of_webelements(cls, webelements):
+        return PageQuery(root=list(webelements))
+
+    def __init__(self, steps=(), root=None, frame=None):
+        self._steps = tuple(steps)
+        self._root = root
+        self._frame = frame
+
+    def __str__(self):
+        return 'PageQuery(%s)' % ', '.join(map(str, self._steps))
+
+    @property
+    def frame(self):
+        return self._frame
+
+    @property
+    def key(self):
+        """
+        hashable value telling queries of the same elements in the document apart from others,
+        None for queries starting from webelements
+        """
+        if self._root is not None:
+            return None
+        return self._frame, tuple(tuple(step) for step in self._steps)
+
+    def _then(self, *step):
+        return PageQuery(self._steps + (list(step),), self._root, self._frame)
+
+    # *** Steps ***
+
+    def all(self, by):
+        compiled = compiled_by(by)
+        if compiled is None:
+            return None
+        return self._then('all', *compiled)
+
+    def at(self, index):
+        return self._then('index', index)
+
+    def first(self):
+        return self.at(0)
+
+    def slice(self, slc):
+        # type: (slice) -> PageQuery
+        if slc.step == 0:
+            raise ValueError('slice step cannot be zero')
+        return self._then('slice', slc.start, slc.stop, slc.step)
+
+    # *** Execution ***
+
+    def _run(self, driver, script, *args, asynchronous=False, timeout=None):
+        # the actual webdriver executes scripts in the current frame, see frames
+        webdriver = frames.unwrapped(driver)
+
+        def run():
+            result = _execute(
+                webdriver, script, [list(step) for step in self._steps], self._root, *args, asynchronous=asynchronous)
+            if not result[0]:
+                raise NoSuchElementException('Element was not found in the page by: %s' % self)
+            return result[1]
+
+        def run_in_frame():
+            return run() if self._frame is None else frames.within(driver, self._frame, run)
+
+        return run_in_frame() if timeout is None else _with_script_timeout(webdriver, timeout, run_in_frame)
+
+    def execute(self, driver, function_body, *args):
+        """
+        executes the function_body in the page with `nodes` - the list of found elements,
+        and `args` - the list of the passed args
+        """
+        return self._run(driver, _EXECUTE_HEAD + function_body + _EXECUTE_TAIL, *args)
+
+    def execute_async(self, driver, function_body, *args, timeout=None):
+        """
+        executes the asynchronous function_body in the page with `resolve(upTo)` - returning the list of elements
+        found by the first upTo steps, all by default (null if some element of the chain was not found),
+        `args` - the list of the passed args, `done(result)` - to finish with the result,
+        `notFound()` - to finish as if elements were not found, and `steps` - the steps of the query;
+        timeout - seconds the function_body may wait before finishing, if it's longer than the session script timeout
+        """
+        return self._run(driver, _EXECUTE_ASYNC_HEAD + function_body + _EXECUTE_ASYNC_TAIL, *args,
+                         asynchronous=True, timeout=timeout)
+
+    @staticmethod
+    def execute_all(driver, queries, function_body, *args):
+        """
+        executes the function_body in the page with `chains` - [steps, root] of each query, resolved in the page by
+        seleneResolve(chain[0], chain[1], chain[0].length), and `args` - the list of the passed args;
+        all queries should be in the same frame
+        """
+        frame = queries[0].frame if queries else None
+        if any(query.frame != frame for query in queries):
+            raise ValueError('queries executed together should be in the same frame')
+        webdriver = frames.unwrapped(driver)
+
+        def run():
+            return _execute(
+                webdriver,
+                _EXECUTE_ALL_HEAD + function_body + _EXECUTE_ALL_TAIL,
+                [[[list(step) for step in query._steps], query._root] for query in queries], *args)
+
+        return run() if frame is None else frames.within(driver, frame, run)
+
+    def count(self, driver):
+        # type: (IWebDriver) -> int
+        return self._run(driver, _COUNT)
+
+    def find_all(self, driver):
+        # type: (IWebDriver) -> List[IWebElement]
+        return self.execute(driver, 'return nodes;')
+
+    def find(self, driver):
+        # type: (IWebDriver) -> IWebElement
+        found = self.execute(driver, 'return nodes[0] || null;')
+        if found is None:
+            raise NoSuchElementException('Element was not found in the page by: %s' % self)
+        return found
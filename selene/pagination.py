@@ -0,0 +1,131 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Iteration over collections paginated by "next page" controls, see paginate
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from selene import config
+from selene.abctypes.conditions import IEntityCondition
+from selene.conditions import not_
+from selene.elements import SeleneElement, _wait_with_screenshot
+from selene.exceptions import ConditionMismatchException
+from selene.page_query import PageQuery
+from selene.snapshot import Snapshot, PAGE_OF_ELEMENTS
+from selene.support.conditions import be
+
+
+class _Page(object):
+    __slots__ = ('identity', 'rows')
+
+    def __init__(self, identity, rows):
+        self.identity = identity
+        self.rows = rows
+
+
+class _PageOf(IEntityCondition):
+    """
+    Takes snapshots of all elements of the collection by one execute_script call,
+    matches if the collection is not on the previous page anymore, i.e. its first element is not the same node
+    with the same key field, and is not absent (as while the next page is loading)
+    """
+
+    def __init__(self, previous, fields, key):
+        # type: (Optional[_Page], List[str], str) -> None
+        self._previous = previous
+        self._fields = fields
+        self._key = key
+
+    def description(self):
+        return 'next page' if self._previous is not None else 'page'
+
+    def fn(self, collection):
+        # type: (SeleneCollection) -> _Page
+        query = collection._locator.page_query()
+        if query is None:
+            query = PageQuery.of_webelements(collection.get_actual_webelements())
+        first, first_key, rows = query.execute(collection._webdriver, PAGE_OF_ELEMENTS, self._fields, self._key)
+        if self._previous is not None:
+            if first is None:
+                raise ConditionMismatchException(message='rows of the next page are not rendered yet')
+            if (first, first_key) == self._previous.identity:
+                raise ConditionMismatchException(
+                    expected='first row other than {}={!r}'.format(self._key, first_key),
+                    actual='the same first row')
+        return _Page((first, first_key), [Snapshot(self._fields, values) for values in rows])
+
+
+def paginate(collection, next_button, until=not_(be.clickable), fields=('text',), key='text', prefetch=False,
+             timeout=None):
+    # type: (SeleneCollection, object, IEntityCondition, Iterable[str], str, bool, Optional[int]) -> Iterable[List[Snapshot]]
+    """
+    Lazily yields snapshots of fields of all elements (rows) of the collection per page,
+    clicking next_button until it matches the `until` condition (by default, until it is absent, hidden or disabled):
+        for rows in paginate(ss('#report tr'), s('#next'), fields=('data-id', 'text')):
+            ...
+    After the click, waits for the page to turn over, i.e. for the first row to be a different node or to have
+    a different value of the key field; each check takes all rows of the page by one execute_script call.
+    With prefetch=True the next page is turned over and taken in the background while the current one is processed,
+    so the driver should not be used until the next page is requested.
+    key and fields are snapshot fields, see SeleneElement#snapshot.
+    """
+    if not isinstance(next_button, SeleneElement):
+        next_button = SeleneElement.by_css_or_by(next_button, collection._webdriver)
+    fields = list(fields)
+    if timeout is None:
+        timeout = config.timeout
+
+    closed = threading.Event()
+
+    def page_after(previous):
+        # type: (Optional[_Page]) -> Optional[_Page]
+        if previous is not None:
+            if closed.is_set():
+                return None
+            next_button.click()
+        return _wait_with_screenshot(
+            collection._webdriver, collection, _PageOf(previous, fields, key), timeout, config.poll_during_waits)
+
+    page = page_after(None)
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    next_page = None
+    try:
+        while not next_button.matches_now(until):
+            if executor is not None:
+                next_page = executor.submit(page_after, page)
+                yield page.rows
+                page = next_page.result()
+            else:
+                yield page.rows
+                page = page_after(page)
+        yield page.rows
+    finally:
+        if executor is not None:
+            # the next page is not turned over if the consumer stopped before the prefetch clicked the button,
+            # otherwise the prefetch is waited for, so the driver is not used by both threads
+            closed.set()
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown()
@@ -0,0 +1,112 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Opt-in memoization of resolved parent elements, shared by all inner lookups inside `with resolution_scope():`
+"""
+import contextlib
+import threading
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+class _State(threading.local):
+    # scopes and probing are per thread, so lookups in other threads (e.g. of pagination prefetch) don't share them
+    resolved = None  # type: Dict[Hashable, Tuple[object, IWebElement]]
+    probing = False
+
+
+_state = _State()
+
+
+@contextlib.contextmanager
+def resolution_scope():
+    """
+    Inside the scope, parents of inner elements and collections are found only once
+    and are found again only when become stale. Nested scopes share the outer one.
+    """
+    if _state.resolved is not None:
+        yield
+        return
+    _state.resolved = {}
+    try:
+        yield
+    finally:
+        _state.resolved = None
+
+
+def within(parent, resolve, command):
+    """
+    calls command on the actual webelement of the parent, resolved by resolve(),
+    or taken from the active resolution scope, where it is refreshed if stale
+    """
+    resolved = _state.resolved
+    if resolved is None:
+        return command(resolve())
+
+    key = _key_of(parent)
+    if key in resolved:
+        try:
+            return command(resolved[key][1])
+        except StaleElementReferenceException:
+            del resolved[key]
+
+    webelement = resolve()
+    # the parent itself is stored to keep ids in its key reserved until the end of the scope
+    resolved[key] = (parent, webelement)
+    return command(webelement)
+
+
+def _key_of(parent):
+    """
+    parents found in the document are shared by their page queries, so equal parents built separately
+    (like s('#a') written twice) are resolved once; other parents (e.g. filtered by conditions checked
+    only by webdriver, whose descriptions don't tell them apart) are shared only by the same object
+    """
+    locator = getattr(parent, '_locator', None)
+    query = locator.page_query() if locator is not None else None
+    query_key = query.key if query is not None else None
+    if query_key is None:
+        return 'object', id(parent)
+    return 'query', id(parent._webdriver), query_key
+
+
+@contextlib.contextmanager
+def probing():
+    """
+    Inside the probing, parents of elements and collections are looked up only once, without waiting
+    """
+    if _state.probing:
+        yield
+        return
+    _state.probing = True
+    try:
+        yield
+    finally:
+        _state.probing = False
+
+
+def nested_timeout(timeout):
+    """
+    returns the timeout to wait for parents of elements and collections, that is 0 inside the probing
+    """
+    return 0 if _state.probing else timeout
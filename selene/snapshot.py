@@ -0,0 +1,262 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# js function, that takes values of fields of the element in the page,
+# the fields are:
+#     text, tag_name, displayed, enabled, selected, rect, location, size - like in SeleneElement
+#     css:<property name> - like in SeleneElement#value_of_css_property
+#     <attribute name> - like in SeleneElement#get_attribute
+_SNAPSHOT = r'''
+function seleneSnapshot(element, fields) {
+    var rect = null;
+    function pageRect() {
+        if (rect === null) {
+            var client = element.getBoundingClientRect();
+            rect = {x: client.left + window.pageXOffset, y: client.top + window.pageYOffset,
+                    width: client.width, height: client.height};
+        }
+        return rect;
+    }
+    return fields.map(function (field) {
+        if (field === 'text') {
+            return seleneRenderedText(element);
+        } else if (field === 'tag_name') {
+            return element.tagName.toLowerCase();
+        } else if (field === 'displayed') {
+            return seleneIsDisplayed(element);
+        } else if (field === 'enabled') {
+            return seleneIsEnabled(element);
+        } else if (field === 'selected') {
+            return seleneIsSelected(element);
+        } else if (field === 'rect') {
+            return pageRect();
+        } else if (field === 'location') {
+            return {x: Math.round(pageRect().x), y: Math.round(pageRect().y)};
+        } else if (field === 'size') {
+            return {width: pageRect().width, height: pageRect().height};
+        } else if (field.indexOf('css:') === 0) {
+            return seleneCssValue(element, field.slice(4));
+        }
+        return seleneAttribute(element, field);
+    });
+}
+'''
+
+SNAPSHOT_OF_ELEMENT = _SNAPSHOT + 'return seleneSnapshot(nodes[0], args[0]);'
+
+SNAPSHOTS_OF_ELEMENTS = _SNAPSHOT + '''
+return nodes.map(function (element) { return seleneSnapshot(element, args[0]); });
+'''
+
+# snapshots of args[0] fields of all options of the select (nodes[0])
+OPTIONS_OF_SELECT = _SNAPSHOT + '''
+return Array.prototype.map.call(nodes[0].options || [], function (option) { return seleneSnapshot(option, args[0]); });
+'''
+
+# page of selene.pagination.paginate: [first element, its args[1] field, snapshots of args[0] fields of all elements]
+PAGE_OF_ELEMENTS = _SNAPSHOT + '''
+return [nodes[0] || null,
+        nodes.length ? seleneSnapshot(nodes[0], [args[1]])[0] : null,
+        nodes.map(function (element) { return seleneSnapshot(element, args[0]); })];
+'''
+
+# asynchronous step of SeleneCollection#scroll_stream: scrolls the container (args[0]) by its height if args[1],
+# waits for the mutations inside it to quiet down (args[4] ms, at most args[5] ms),
+# and returns [key (args[2] field), snapshot of args[3] fields or the element itself] of each rendered element,
+# whether the container was scrolled and whether its end was reached
+SCROLL_STEP_OF_ELEMENTS = _SNAPSHOT + r'''
+var container = args[0], fields = args[3];
+var before = container.scrollTop;
+if (args[1]) {
+    container.scrollTop = before + container.clientHeight;
+}
+var moved = container.scrollTop !== before;
+seleneWhenQuiet(container, args[1] ? args[4] : 0, args[5], function () {
+    var nodes = resolve();
+    if (nodes === null) {
+        notFound();
+        return;
+    }
+    done({
+        rows: nodes.map(function (element) {
+            return [seleneSnapshot(element, [args[2]])[0], fields === null ? element : seleneSnapshot(element, fields)];
+        }),
+        moved: moved,
+        end: container.scrollTop + container.clientHeight >= container.scrollHeight - 1
+    });
+});
+'''
+
+
+class Snapshot(object):
+    """
+    Immutable record of element properties, taken by one execute_script call.
+    Values are accessible by field names as items, i.e. snapshot['css:color'],
+    or as attributes for field names that are valid identifiers, i.e. snapshot.text
+    """
+    __slots__ = ('_fields', '_values')
+
+    def __init__(self, fields, values):
+        # type: (Tuple[str, ...], List[object]) -> None
+        object.__setattr__(self, '_fields', tuple(fields))
+        object.__setattr__(self, '_values', tuple(values))
+
+    def __getitem__(self, field):
+        try:
+            return self._values[self._fields.index(field)]
+        except ValueError:
+            raise KeyError(field)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Snapshot is immutable')
+
+    def __eq__(self, other):
+        return isinstance(other, Snapshot) and self.as_dict() == other.as_dict()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'Snapshot(%s)' % ', '.join('%s=%r' % item for item in zip(self._fields, self._values))
+
+    def as_dict(self):
+        return dict(zip(self._fields, self._values))
+
+
+# *** Extraction of table-like data ***
+
+_EXTRACT = _SNAPSHOT + r'''
+function seleneExtract(rows, columns) {
+    return columns.map(function (column) {
+        return rows.map(function (row) {
+            var cell = column[0] === null ? row : seleneFindFirst(row, column[0], column[1]);
+            return cell ? seleneSnapshot(cell, [column[2]])[0] : null;
+        });
+    });
+}
+'''
+
+EXTRACT_OF_ELEMENTS = _EXTRACT + 'return seleneExtract(nodes, args[0]);'
+
+
+def as_numpy_records(names, columns):
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('numpy is required to extract columns as numpy arrays, install it via `pip install numpy`')
+    return numpy.rec.fromarrays([numpy.array(column) for column in columns], names=list(names))
+
+# asynchronous scripts of selene.elements.CollectionWatcher, watchers are kept in window.seleneWatchers by ids (args[0])
+
+# installs the watcher: MutationObserver of the containers of the collection (elements found by the steps
+# before the last 'all' one), that records [kind, element or snapshot of args[1] fields] of added and removed elements
+WATCH_ELEMENTS = _SNAPSHOT + r'''
+var id = args[0], fields = args[1];
+var lastAll = 0;
+steps.forEach(function (step, index) {
+    if (step[0] === 'all') {
+        lastAll = index;
+    }
+});
+var containers = resolve(lastAll);
+if (containers === null) {
+    notFound();
+    return;
+}
+var watchers = window.seleneWatchers = window.seleneWatchers || {};
+var watcher = {buffer: [], members: new Set(resolve() || []), snapshots: new Map(), waiting: null};
+function recorded(element) {
+    if (fields !== null) {
+        watcher.snapshots.set(element, seleneSnapshot(element, fields));
+    }
+    return fields === null ? element : watcher.snapshots.get(element);
+}
+watcher.members.forEach(recorded);
+watcher.observer = new MutationObserver(function () {
+    var current = new Set(resolve() || []);
+    current.forEach(function (element) {
+        if (!watcher.members.has(element)) {
+            watcher.buffer.push(['added', recorded(element)]);
+        }
+    });
+    watcher.members.forEach(function (element) {
+        if (!current.has(element)) {
+            watcher.buffer.push(['removed', fields === null ? element : watcher.snapshots.get(element)]);
+            watcher.snapshots.delete(element);
+        }
+    });
+    watcher.members = current;
+    if (watcher.buffer.length && watcher.waiting !== null) {
+        watcher.waiting();
+    }
+});
+containers.forEach(function (container) {
+    watcher.observer.observe(container, {childList: true, subtree: true});
+});
+if (watchers[id]) {
+    watchers[id].observer.disconnect();
+}
+watchers[id] = watcher;
+done(null);
+'''
+
+# takes and clears the recorded changes, waiting for them at most args[1] ms, null if the watcher is gone
+DRAIN_WATCHED = r'''
+var watcher = (window.seleneWatchers || {})[args[0]];
+if (!watcher) {
+    done(null);
+    return;
+}
+function drain() {
+    var changes = watcher.buffer;
+    watcher.buffer = [];
+    watcher.waiting = null;
+    done(changes);
+}
+if (watcher.buffer.length || args[1] <= 0) {
+    drain();
+    return;
+}
+var timer = setTimeout(drain, args[1]);
+watcher.waiting = function () {
+    clearTimeout(timer);
+    drain();
+};
+'''
+
+STOP_WATCHING = r'''
+var watchers = window.seleneWatchers || {};
+if (watchers[args[0]]) {
+    watchers[args[0]].observer.disconnect();
+    delete watchers[args[0]];
+}
+done(null);
+'''
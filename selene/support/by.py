@@ -55,6 +55,10 @@ def partial_text(element_text):
     return bys.by_partial_text(element_text)
 
 
+def shadow(path):
+    return bys.by_shadow(path)
+
+
 def be_following_sibling():
     return bys.following_sibling()
 
@@ -65,3 +69,23 @@ def be_parent():
 
 def be_first_child():
     return bys.first_child()
+
+
+def above(anchor, selector='*'):
+    return bys.above(anchor, selector)
+
+
+def below(anchor, selector='*'):
+    return bys.below(anchor, selector)
+
+
+def left_of(anchor, selector='*'):
+    return bys.left_of(anchor, selector)
+
+
+def right_of(anchor, selector='*'):
+    return bys.right_of(anchor, selector)
+
+
+def near(anchor, selector='*', distance=50):
+    return bys.near(anchor, selector, distance)
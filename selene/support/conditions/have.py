@@ -33,12 +33,12 @@ def not_(condition_to_be_inverted):
 # *** SeleneElement conditions ***
 
 
-def exact_text(value):
-    return conditions.exact_text(value)
+def exact_text(value, strategy=None):
+    return conditions.exact_text(value, strategy)
 
 
-def text(partial_value):
-    return conditions.text(partial_value)
+def text(partial_value, strategy=None):
+    return conditions.text(partial_value, strategy)
 
 
 def attribute(name, value):
@@ -68,12 +68,12 @@ def size_greater_than_or_equal(minimum_size_of_collection):
     return conditions.size_at_least(minimum_size_of_collection)
 
 
-def exact_texts(*values):
-    return conditions.exact_texts(*values)
+def exact_texts(*values, strategy=None):
+    return conditions.exact_texts(*values, strategy=strategy)
 
 
-def texts(*partial_values):
-    return conditions.texts(*partial_values)
+def texts(*partial_values, strategy=None):
+    return conditions.texts(*partial_values, strategy=strategy)
 
 
 # *** WebDriver conditions ***
@@ -0,0 +1,125 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Strategies of taking texts of elements, configured by config.text_strategy or per text condition.
+Texts are taken by WebElement#text (one command per element) for the default rendered strategy,
+and in the page (by one execute_script call for all elements of collection) for other ones.
+"""
+import json
+
+from selene import config
+from selene.page_query import PageQuery
+
+
+class TextStrategy(object):
+    # WebElement#text: text of visible elements, as rendered (forces layout)
+    RENDERED = 'rendered'
+    # approximation of WebElement#text taken in the page: innerText of visible elements (forces layout)
+    RENDERED_IN_PAGE = 'renderedInPage'
+    # element.innerText: rendered text without the checks for visibility (forces layout)
+    INNER_TEXT = 'innerText'
+    # element.textContent: text of all descendants, including hidden ones (does not force layout)
+    TEXT_CONTENT = 'textContent'
+    # element.textContent with whitespace collapsed to single spaces and trimmed (does not force layout)
+    NORMALIZED = 'normalized'
+
+
+_STRATEGIES = frozenset([TextStrategy.RENDERED, TextStrategy.RENDERED_IN_PAGE, TextStrategy.INNER_TEXT,
+                         TextStrategy.TEXT_CONTENT, TextStrategy.NORMALIZED])
+
+TEXT_OF_ELEMENT = 'return seleneText(nodes[0], args[0]);'
+
+TEXTS_OF_ELEMENTS = 'return nodes.map(function (element) { return seleneText(element, args[0]); });'
+
+
+def checked(strategy):
+    # type: (Optional[str]) -> Optional[str]
+    if strategy is not None and strategy not in _STRATEGIES:
+        raise ValueError('unknown text strategy: {}, expected one of: {}'.format(
+            strategy, ', '.join(sorted(_STRATEGIES))))
+    return strategy
+
+
+def resolved(strategy):
+    # type: (Optional[str]) -> str
+    """
+    returns the strategy, or the configured one if it is None
+    """
+    return checked(strategy if strategy is not None else config.text_strategy)
+
+
+def in_page_text(strategy):
+    # type: (str) -> Optional[str]
+    """
+    returns the body of js function(element) returning text of the element by the strategy,
+    or None for the rendered strategy, that is taken by WebElement#text
+    """
+    if strategy == TextStrategy.RENDERED:
+        return None
+    return 'return seleneText(element, {});'.format(json.dumps(strategy))
+
+
+def text_of(element, strategy):
+    # type: (SeleneElement, str) -> str
+    """
+    takes text of the element once (without waiting), by one execute_script call if the locator can be processed
+    in the page, or via WebElement#text for the rendered strategy
+    """
+    if strategy == TextStrategy.RENDERED:
+        return element.get_actual_webelement().text
+    query = element._locator.page_query()
+    if query is None:
+        query = PageQuery.of_webelement(element.get_actual_webelement())
+    return query.execute(element._webdriver, TEXT_OF_ELEMENT, strategy)
+
+
+def texts_of(elements, strategy):
+    # type: (SeleneCollection, str) -> List[str]
+    """
+    takes texts of all elements of the collection once (without waiting), by one execute_script call
+    (including the search of elements if the locator can be processed in the page),
+    or via WebElement#text of each element for the rendered strategy
+    """
+    if strategy == TextStrategy.RENDERED:
+        return [webelement.text for webelement in elements.get_actual_webelements()]
+    query = elements._locator.page_query()
+    if query is None:
+        query = PageQuery.of_webelements(elements.get_actual_webelements())
+    return query.execute(elements._webdriver, TEXTS_OF_ELEMENTS, strategy)
+
+
+def webelement_text(webelement, strategy):
+    # type: (IWebElement, str) -> str
+    if strategy == TextStrategy.RENDERED:
+        return webelement.text
+    return PageQuery.of_webelement(webelement).execute(webelement.parent, TEXT_OF_ELEMENT, strategy)
+
+
+def webelements_texts(webelements, strategy):
+    # type: (List[IWebElement], str) -> List[str]
+    if strategy == TextStrategy.RENDERED:
+        return [webelement.text for webelement in webelements]
+    if not webelements:
+        return []
+    return PageQuery.of_webelements(webelements).execute(webelements[0].parent, TEXTS_OF_ELEMENTS, strategy)
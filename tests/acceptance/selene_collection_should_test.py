@@ -47,3 +47,15 @@ def test_should_fails():
     given_active("a", "b")
     with pytest.raises(TimeoutException):
         ss("#todo-list>li").should(have.exact_texts("a.", "b."), timeout=0.1)
+
+
+def test_should_each_passes():
+    given_active("a", "b")
+    ss("#todo-list>li").should_each(have.css_class("active"))
+
+
+def test_should_each_fails_with_all_failed_indexes():
+    given_active("a", "b")
+    with pytest.raises(TimeoutException) as ex:
+        ss("#todo-list>li").should_each(have.css_class("completed"), timeout=0.1)
+    assert 'condition did not match for elements at indexes: 0, 1' in ex.value.msg
@@ -0,0 +1,80 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Microbenchmark of python-side overhead of delegated calls of SeleneElement, no browser is needed:
+    python -m tests.delegation_benchmark
+"""
+import timeit
+
+from selene.abctypes.locators import ISeleneWebElementLocator
+from selene.elements import SeleneElement
+
+
+class FakeWebElement(object):
+    def find_element_by_id(self, id_):
+        return id_
+
+
+class FoundLocator(ISeleneWebElementLocator):
+    __slots__ = ('_webelement',)
+
+    description = 'found'
+
+    def __init__(self, webelement):
+        self._webelement = webelement
+
+    def find(self):
+        return self._webelement
+
+
+def _getattr_delegator(name):
+    # the way delegators were made before they were generated with explicit signatures
+    def delegator(self, *args, **kwargs):
+        return getattr(self.__delegate__, name)(*args, **kwargs)
+    return delegator
+
+
+class GetattrDelegatingElement(SeleneElement):
+    __slots__ = ()
+    find_element_by_id = _getattr_delegator('find_element_by_id')
+
+
+def main(number=200000):
+    webelement = FakeWebElement()
+    element = SeleneElement(FoundLocator(webelement), None)
+    old_style = GetattrDelegatingElement(FoundLocator(webelement), None)
+    # find_element_by_id is not implemented by SeleneElement, so it is delegated by DelegatingMeta
+    cases = [
+        ('webelement call (baseline)', lambda: webelement.find_element_by_id('x')),
+        ('getattr delegator', lambda: old_style.find_element_by_id('x')),
+        ('generated delegator', lambda: element.find_element_by_id('x')),
+    ]
+    for description, call in cases:
+        best = min(timeit.repeat(call, number=number, repeat=5))
+        print('{description:<30} {nanoseconds:8.0f} ns per call'.format(
+            description=description, nanoseconds=best / number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
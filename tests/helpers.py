@@ -22,6 +22,110 @@
 
 import time
 
+from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class FakeWebElement(object):
+    """
+    Visible and enabled webelement, which commands are recorded to the log of its webdriver,
+    or fail as stale while the webdriver (if given) has stale actions left
+    """
+
+    def __init__(self, log, name, webdriver=None):
+        self.log = log
+        self.name = name
+        self.webdriver = webdriver
+
+    def _perform(self, *action):
+        if self.webdriver is not None and self.webdriver.stale > 0:
+            self.webdriver.stale -= 1
+            raise StaleElementReferenceException()
+        self.log.append(action)
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    @property
+    def text(self):
+        self.log.append(('text', self.name))
+        return self.name
+
+    def click(self):
+        self._perform('click', self.name)
+
+    def clear(self):
+        self._perform('clear', self.name)
+
+    def send_keys(self, *value):
+        self._perform('send_keys', self.name, *value)
+
+    def find_element(self, by=None, value=None):
+        return FakeWebElement(self.log, '{} {}'.format(self.name, value))
+
+
+class FakeSwitchTo(object):
+    """
+    Switching to frames, recorded to the log of its webdriver
+    """
+
+    def __init__(self, log):
+        self.log = log
+
+    def default_content(self):
+        self.log.append(('switch_to', 'default'))
+
+    def frame(self, frame_reference):
+        self.log.append(('switch_to', frame_reference.name))
+
+
+class FakeWebDriver(WebDriver):
+    """
+    Webdriver returning the given results of executed (also asynchronous) scripts one by one, and fake webelements
+    found by any locator but `missing` ones (finds are counted); arguments of executed scripts are recorded
+    to scripts, other commands are recorded to log; the first `stale` actions of found webelements fail as stale
+    """
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.scripts = []
+        self.log = []
+        self.finds = 0
+        self.stale = 0
+        self.missing = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(list(args))
+        return self.results.pop(0)
+
+    def execute_async_script(self, script, *args):
+        return self.execute_script(script, *args)
+
+    def set_script_timeout(self, time_to_wait):
+        self.log.append(('script_timeout', time_to_wait))
+
+    def find_element(self, by=None, value=None):
+        self.finds += 1
+        if value in self.missing:
+            raise NoSuchElementException()
+        return FakeWebElement(self.log, value, self)
+
+    def find_elements(self, by=None, value=None):
+        self.finds += 1
+        return [] if value in self.missing else [FakeWebElement(self.log, value, self)]
+
+    @property
+    def switch_to(self):
+        return FakeSwitchTo(self.log)
+
+    @property
+    def title(self):
+        self.log.append('title')
+        return ''
+
 
 def time_spent(function, *args, **kwargs):
 
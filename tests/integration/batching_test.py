@@ -0,0 +1,73 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from selene import batching
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_batch_performs_actions_in_page_and_falls_back_for_hidden_elements():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <input id="name" oninput="document.getElementById('typed').textContent = this.value">
+        <span id="typed"></span>
+        <input id="agree" type="checkbox" onclick="setTimeout(function () { document.getElementById('email').style.display = 'inline'; }, 300)">
+        <input id="email" style="display: none">
+        ''')
+
+    with batching.batch() as batch:
+        driver.element('#name').set('Bob')
+        driver.element('#agree').click()
+        driver.element('#email').set('bob@example.com')
+
+    assert [(step.in_page, step.error) for step in batch.steps] == \
+        [(True, None), (True, None), (False, 'element is not visible')]
+    driver.element('#typed').should(have.exact_text('Bob'))
+    driver.element('#email').should(have.value('bob@example.com'))
+    assert driver.element('#agree').is_selected()
+
+
+def test_batch_performs_recorded_actions_before_scripts_of_driver():
+    GIVEN_PAGE.opened_with_body('<input id="name">')
+
+    with batching.batch():
+        driver.element('#name').set('Bob')
+        assert driver.execute_script('return document.getElementById("name").value') == 'Bob'
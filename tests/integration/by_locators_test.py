@@ -127,3 +127,43 @@ def test_complex_locator_based_on_selene_element_relative_elements():
         .first_child\
         .click()
     assert ('second' in driver.current_url) is True
+
+
+def test_geometry_relative_locators():
+    GIVEN_PAGE\
+        .opened_with_body(
+            '''
+            <form id="form">
+                <div><label>First name</label> <input name="first"> <input name="other"></div>
+                <div><label>Last name</label> <input name="last"></div>
+            </form>
+            ''')
+
+    driver.element('#form').element(by.right_of(by.text('First name'), 'input')).set_value('Bob')
+    assert driver.element('[name="first"]').get_attribute('value') == 'Bob'
+    assert driver.all(by.right_of(by.text('First name'), 'input')).size() == 2
+    assert driver.element(by.below(by.text('First name'), 'label')).text == 'Last name'
+    assert driver.element(by.near('[name="last"]', 'label')).text == 'Last name'
+    assert driver.element(by.near('[name="last"]')).tag_name == 'label'
+
+
+def test_shadow_dom_piercing_locators():
+    GIVEN_PAGE\
+        .opened_with_body(
+            '''
+            <my-form><my-input id="first"></my-input><my-input id="last"></my-input></my-form>
+            ''')\
+        .execute_script_with_timeout(
+            '''
+            var form = document.querySelector('my-form');
+            form.attachShadow({mode: 'open'}).innerHTML = '<slot></slot><button>Save</button>';
+            document.querySelectorAll('my-input').forEach(function (field) {
+                field.attachShadow({mode: 'open'}).innerHTML = '<input name="' + field.id + '">';
+            });
+            ''', 250)
+
+    driver.element(by.shadow('#last >>> input')).set_value('Kate')
+    assert driver.element(by.shadow('my-input >>> input')).get_attribute('name') == 'first'
+    assert driver.all(by.shadow('my-input >>> input')).size() == 2
+    assert driver.element('#last').element(by.shadow('>>> input')).get_attribute('value') == 'Kate'
+    assert driver.element(by.shadow('my-form >>> button')).text == 'Save'
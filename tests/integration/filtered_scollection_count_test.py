@@ -26,7 +26,7 @@ from webdriver_manager.firefox import GeckoDriverManager
 from selene import config
 from selene.common.none_object import NoneObject
 from selene.driver import SeleneDriver
-from selene.support.conditions import have
+from selene.support.conditions import be, have
 from tests.acceptance.helpers.helper import get_test_driver
 from tests.integration.helpers.givenpage import GivenPage
 
@@ -62,3 +62,36 @@ def test_counts_invisible_tasks():
                        <li class='will-appear' style='display:none'>Kate</li>
                    </ul>''')
     assert len(elements) == 2
+
+
+def test_counts_visible_tasks_with_hidden_ancestors():
+    GIVEN_PAGE.opened_with_body('''
+                   <ul>Hello to:
+                       <li>Anonymous</li>
+                       <li style='display:none'>Bob</li>
+                       <li style='visibility:hidden'>Kate</li>
+                   </ul>
+                   <ol style='opacity:0'>
+                       <li>Mike</li>
+                   </ol>
+                   <div style='display:none'><ol><li>Lucy</li></ol></div>''')
+
+    assert len(driver.all('li').filtered_by(be.visible)) == 1
+    assert len(driver.all('li').filtered_by(be.hidden)) == 4
+    driver.all('li').filtered_by(be.visible).should_each(be.visible)
+    driver.all('ol li').should_each(be.hidden)
+
+
+def test_probes_elements_without_waiting():
+    GIVEN_PAGE.opened_with_body('''
+                   <ul>Hello to:
+                       <li class='will-appear'>Bob</li>
+                       <li style='display:none'>Kate</li>
+                   </ul>''')
+
+    assert driver.all('li').count_now() == 2
+    assert driver.element('ul').all('li').filtered_by(be.visible).count_now() == 1
+    assert driver.element('ul').element('.will-appear').exists_now()
+    assert not driver.element('ol').element('li').exists_now()
+    assert driver.all('ol li').count_now() == 0
+    assert driver.all('li')[1].matches_now(be.hidden)
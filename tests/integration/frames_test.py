@@ -0,0 +1,101 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from selene import frames
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_framed_and_top_level_elements_are_found_in_turn():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <iframe id="editor" srcdoc="<input id='title'><iframe id='preview' srcdoc='<h1>Preview</h1>'></iframe>">
+        </iframe>
+        <button id="save" onclick="this.textContent = 'Saved'">Save</button>
+        ''')
+    editor = driver.frame('#editor')
+
+    editor.element('#title').set_value('Hello')
+    driver.element('#save').click()
+    editor.element('#title').should(have.value('Hello'))
+    editor.frame('#preview').element('h1').should(have.exact_text('Preview'))
+    driver.element('#save').should(have.exact_text('Saved'))
+
+
+def test_framed_collection_is_found_in_frame():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <iframe id="list" srcdoc="<ul><li>a</li><li>b</li></ul>"></iframe>
+        <ul><li>c</li></ul>
+        ''')
+
+    driver.frame('#list').all('li').should(have.exact_texts('a', 'b'))
+    driver.all('li').should(have.exact_texts('c'))
+
+
+def test_framed_elements_are_found_in_re_rendered_frame():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <div id="container"><iframe id="editor" srcdoc="<input id='title'>"></iframe></div>
+        ''')
+    editor = driver.frame('#editor')
+    editor.element('#title').set_value('Hello')
+
+    frames.leave(driver)
+    driver.execute_script(
+        'document.getElementById("container").innerHTML = '
+        '"<iframe id=\'editor\' srcdoc=\'<input id=title value=New>\'></iframe>";')
+
+    editor.element('#title').should(have.value('New'))
+
+
+def test_scripts_are_executed_in_frame_of_elements_found_last():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <iframe id="editor" srcdoc="<title>Editor</title><input id='title'>"></iframe>
+        ''')
+    driver.execute_script('document.title = "Page"')
+
+    title = driver.frame('#editor').element('#title').set_value('Hello')
+
+    assert driver.execute_script('return [document.title, arguments[0].value]', title()) == ['Editor', 'Hello']
+    frames.leave(driver)
+    assert driver.execute_script('return document.title') == 'Page'
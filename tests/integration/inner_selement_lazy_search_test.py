@@ -25,6 +25,7 @@ from selenium import webdriver
 from selene import config
 from selene.common.none_object import NoneObject
 from selene.driver import SeleneDriver
+from selene.resolution import resolution_scope
 from tests.acceptance.helpers.helper import get_test_driver
 from tests.integration.helpers.givenpage import GivenPage
 
@@ -100,3 +101,19 @@ def test_search_finds_exactly_inside_parent():
 
     driver.element('p').element('a').click()
     assert ("second" in driver.current_url) is True
+
+
+def test_search_in_resolution_scope_is_updated_when_parent_is_rerendered():
+    GIVEN_PAGE.opened_with_body('''
+        <h1 id="parent">
+            <span class="first">Hello</span> <span class="second">kitty</span>
+        </h1>''')
+    parent = driver.element('#parent')
+
+    with resolution_scope():
+        assert parent.element('.first').text == 'Hello'
+        WHEN.load_body('''
+            <h1 id="parent">
+                <span class="first">Bye</span> <span class="second">doggy</span>
+            </h1>''')
+        assert parent.element('.second').text == 'doggy'
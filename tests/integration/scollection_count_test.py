@@ -59,3 +59,48 @@ def test_counts_invisible_tasks():
                        <li class='will-appear' style='display:none'>Kate</li>
                    </ul>''')
     assert len(elements) == 2
+
+
+def test_counts_by_xpath():
+    GIVEN_PAGE.opened_empty()
+    elements = driver.all('//li[@class="will-appear"]')
+
+    WHEN.load_body('''
+                   <ul>Hello to:
+                       <li class='will-appear'>Bob</li>
+                       <li class='will-appear' style='display:none'>Kate</li>
+                   </ul>''')
+    assert len(elements) == 2
+
+
+def test_counts_inner_elements_of_indexed_element():
+    GIVEN_PAGE.opened_empty()
+    elements = driver.all('ul')[1].all('li')
+
+    WHEN.load_body('''
+                   <ul>Hello to:
+                       <li>Bob</li>
+                   </ul>
+                   <ul>Bye to:
+                       <li>Kate</li>
+                       <li>Joe</li>
+                   </ul>''')
+    assert len(elements) == 2
+    assert elements.size() == 2
+
+
+def test_counts_sliced_elements_with_open_and_negative_bounds():
+    GIVEN_PAGE.opened_with_body('''
+                   <ul>Hello to:
+                       <li>Bob</li>
+                       <li>Kate</li>
+                       <li>Mike</li>
+                       <li>Lucy</li>
+                   </ul>''')
+    elements = driver.all('li')
+
+    assert len(elements[1:]) == 3
+    assert len(elements[:-1]) == 3
+    assert len(elements[::-2]) == 2
+    assert len(elements[10:]) == 0
+    assert [webelement.text for webelement in elements[-2:].get_actual_webelements()] == ['Mike', 'Lucy']
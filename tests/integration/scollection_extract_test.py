@@ -0,0 +1,60 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_extract_takes_columns_of_all_rows():
+    GIVEN_PAGE.opened_with_body('''
+        <table>
+            <tr data-id="1"><td class="name">apple</td><td class="price" data-value="1.5">$1.50</td></tr>
+            <tr data-id="2"><td class="name">pear</td></tr>
+        </table>''')
+
+    columns = driver.all('tr').extract(columns={
+        'id': (None, 'data-id'),
+        'name': 'td.name',
+        'price': ('td.price', 'data-value'),
+        'name_by_xpath': './td[1]'})
+
+    assert columns == {
+        'id': ['1', '2'],
+        'name': ['apple', 'pear'],
+        'price': ['1.5', None],
+        'name_by_xpath': ['apple', 'pear']}
@@ -0,0 +1,111 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import time
+
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.pagination import paginate
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def given_report_of(total, per_page, keep_rows=False):
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <table id="report"><tbody></tbody></table>
+        <button id="next">Next</button>
+        ''')
+    GIVEN_PAGE.execute_script(
+        '''
+        var page = 0, total = %s, perPage = %s, keepRows = %s;
+        var body = document.querySelector('#report tbody'), next = document.getElementById('next');
+        function render() {
+            body.innerHTML = '';
+            for (var i = page * perPage; i < Math.min(total, (page + 1) * perPage); i++) {
+                body.insertAdjacentHTML('beforeend', '<tr data-id="' + i + '"><td>row ' + i + '</td></tr>');
+            }
+            next.disabled = (page + 1) * perPage >= total;
+        }
+        next.addEventListener('click', function () {
+            page += 1;
+            if (!keepRows) {
+                body.innerHTML = '';
+            }
+            setTimeout(render, 300);
+        });
+        render();
+        ''' % (total, per_page, 'true' if keep_rows else 'false'))
+
+
+def test_paginate_yields_rows_of_all_pages():
+    given_report_of(total=7, per_page=3)
+
+    pages = list(paginate(driver.all('#report tr'), '#next', fields=('data-id', 'text'), key='data-id'))
+
+    assert [[row['data-id'] for row in rows] for rows in pages] == [['0', '1', '2'], ['3', '4', '5'], ['6']]
+    assert pages[2][0].text == 'row 6'
+
+
+def test_paginate_with_prefetch_yields_the_same_rows():
+    given_report_of(total=7, per_page=3)
+
+    pages = list(paginate(driver.all('#report tr'), '#next', key='data-id', prefetch=True))
+
+    assert [[row.text for row in rows] for rows in pages] == \
+        [['row 0', 'row 1', 'row 2'], ['row 3', 'row 4', 'row 5'], ['row 6']]
+
+
+def test_paginate_waits_for_page_to_turn_over_while_rows_of_previous_page_are_shown():
+    given_report_of(total=5, per_page=3, keep_rows=True)
+
+    pages = list(paginate(driver.all('#report tr'), '#next'))
+
+    assert [[row.text for row in rows] for rows in pages] == [['row 0', 'row 1', 'row 2'], ['row 3', 'row 4']]
+
+
+def test_paginate_with_prefetch_turns_next_page_over_while_current_one_is_processed():
+    given_report_of(total=7, per_page=3)
+    pages = paginate(driver.all('#report tr'), '#next', key='data-id', prefetch=True)
+
+    assert [row.text for row in next(pages)] == ['row 0', 'row 1', 'row 2']
+    time.sleep(1)
+    started = time.time()
+    assert [row.text for row in next(pages)] == ['row 3', 'row 4', 'row 5']
+    assert time.time() - started < 0.3
+    assert [[row.text for row in rows] for rows in pages] == [['row 6']]
@@ -0,0 +1,59 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+WHEN = GIVEN_PAGE  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+    global WHEN
+    WHEN = GIVEN_PAGE
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_prefetch_children_of_all_rows():
+    GIVEN_PAGE.opened_with_body('''
+        <ul>
+            <li class="item"><span class="name">apple</span><span class="qty">1</span></li>
+            <li class="item"><span class="name">pear</span></li>
+        </ul>''')
+
+    rows = driver.all('.item').prefetch_children({'name': '.name', 'qty': '.qty'})
+
+    assert [row['name'].text for row in rows] == ['apple', 'pear']
+    assert rows[0]['qty'].text == '1'
+    WHEN.load_body_with_timeout('''<ul><li class="item"><span class="qty">2</span></li></ul>''', 250)
+    rows[0]['qty'].should(have.exact_text('2'))
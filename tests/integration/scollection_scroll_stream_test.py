@@ -0,0 +1,86 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def given_virtualized_list_of(total):
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <div id="grid" style="height: 100px; overflow-y: scroll; position: relative">
+            <div id="spacer" style="height: %spx"></div>
+        </div>
+        ''' % (total * 20))
+    GIVEN_PAGE.execute_script(
+        '''
+        var grid = document.getElementById('grid');
+        function render() {
+            Array.prototype.slice.call(grid.querySelectorAll('.row')).forEach(function (row) { row.remove(); });
+            var first = Math.floor(grid.scrollTop / 20);
+            for (var i = first; i < Math.min(%s, first + 6); i++) {
+                var row = document.createElement('div');
+                row.className = 'row';
+                row.setAttribute('data-id', String(i));
+                row.textContent = 'row ' + i;
+                row.style.cssText = 'position: absolute; height: 20px; top: ' + (i * 20) + 'px';
+                grid.appendChild(row);
+            }
+        }
+        grid.addEventListener('scroll', function () { setTimeout(render, 50); });
+        render();
+        ''' % total)
+
+
+def test_scroll_stream_yields_all_rows_of_virtualized_list_once():
+    given_virtualized_list_of(200)
+
+    rows = list(driver.all('#grid .row').scroll_stream('#grid', key='data-id', fields=('data-id', 'text')))
+
+    assert [row['data-id'] for row in rows] == [str(i) for i in range(200)]
+    assert rows[199].text == 'row 199'
+
+
+def test_scroll_stream_yields_elements():
+    given_virtualized_list_of(3)
+
+    rows = list(driver.all('#grid .row').scroll_stream('#grid', key='data-id'))
+
+    assert [row.get_attribute('data-id') for row in rows] == ['0', '1', '2']
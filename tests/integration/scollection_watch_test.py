@@ -0,0 +1,113 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from selene import page_query
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.elements import CollectionWatcher
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_watch_records_added_and_removed_elements():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <div id="chat"><p class="message">hello</p></div>
+        <button id="send" onclick="
+            var chat = document.getElementById('chat');
+            setTimeout(function () { chat.insertAdjacentHTML('beforeend', '<p class=message>first</p>'); }, 100);
+            setTimeout(function () { chat.insertAdjacentHTML('beforeend', '<p class=message>second</p>'); }, 200);
+            setTimeout(function () { chat.removeChild(chat.firstChild); }, 300);
+        ">Send</button>
+        ''')
+
+    with driver.element('#chat').all('.message').watch(fields=('text',), timeout=1) as messages:
+        driver.element('#send').click()
+        changes = [(kind, message.text) for kind, message in messages]
+
+    assert changes == [(CollectionWatcher.ADDED, 'first'),
+                       (CollectionWatcher.ADDED, 'second'),
+                       (CollectionWatcher.REMOVED, 'hello')]
+
+
+def test_watch_yields_elements_bound_to_added_webelements():
+    GIVEN_PAGE.opened_with_body('<ul id="list"></ul>')
+
+    with driver.all('#list li').watch(timeout=1) as items:
+        GIVEN_PAGE.execute_script_with_timeout(
+            'document.getElementById("list").insertAdjacentHTML("beforeend", "<li>new</li>");', 100)
+        changes = [(kind, item.text) for kind, item in items]
+
+    assert changes == [(CollectionWatcher.ADDED, 'new')]
+
+
+def test_drain_of_stopped_watch_fails():
+    GIVEN_PAGE.opened_with_body('<ul id="list"><li>a</li></ul>')
+    items = driver.all('#list li').watch()
+    items.stop()
+
+    with pytest.raises(NoSuchElementException):
+        items.drain()
+
+
+def test_drain_of_watch_lost_with_its_page_fails():
+    GIVEN_PAGE.opened_with_body('<ul id="list"><li>a</li></ul>')
+    items = driver.all('#list li').watch()
+    GIVEN_PAGE.opened_with_body('<ul id="list"><li>b</li></ul>')
+
+    with pytest.raises(NoSuchElementException):
+        items.drain()
+
+
+def test_drain_waits_for_changes_longer_than_session_script_timeout():
+    GIVEN_PAGE.opened_with_body('<ul id="list"></ul>')
+    driver.set_script_timeout(0.1)
+    try:
+        with driver.all('#list li').watch() as items:
+            GIVEN_PAGE.execute_script_with_timeout(
+                'document.getElementById("list").insertAdjacentHTML("beforeend", "<li>new</li>");', 500)
+            changes = [(kind, item.text) for kind, item in items.drain(timeout=2)]
+
+        assert changes == [(CollectionWatcher.ADDED, 'new')]
+        with pytest.raises(TimeoutException):
+            driver.execute_async_script('setTimeout(arguments[0], 500);')
+    finally:
+        driver.set_script_timeout(page_query.DEFAULT_SCRIPT_TIMEOUT)
@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from selene import config
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_fast_set_value_sets_long_text_firing_events_once_per_change():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <textarea id="json" oninput="var c = document.getElementById('inputs'); c.textContent = +c.textContent + 1">
+        </textarea>
+        <span id="inputs">0</span>
+        ''')
+    text = '{"items": [%s]}' % ', '.join(['"item"'] * 2000)
+
+    driver.element('#json').set_value(text, fast=True)
+    driver.element('#json').set_value(text, fast=True)
+
+    driver.element('#json').should(have.value(text))
+    driver.element('#inputs').should(have.exact_text('1'))
+
+
+def test_fast_set_value_types_into_fields_that_did_not_accept_value_as_is():
+    GIVEN_PAGE.opened_with_body('<input id="code" oninput="this.value = this.value.toUpperCase()">')
+
+    driver.element('#code').set_value('abc', fast=True)
+
+    driver.element('#code').should(have.value('ABC'))
+
+
+def test_fast_set_value_waits_for_field_to_become_editable():
+    GIVEN_PAGE.opened_with_body('<input id="name" disabled>')
+    GIVEN_PAGE.execute_script_with_timeout('document.getElementById("name").disabled = false;', 250)
+
+    driver.element('#name').set_value('Bob', fast=True)
+
+    driver.element('#name').should(have.value('Bob'))
+
+
+def test_set_value_is_fast_by_config():
+    GIVEN_PAGE.opened_with_body(
+        '<input id="name" onkeydown="document.getElementById(\'keys\').textContent += \'k\'"><span id="keys"></span>')
+    original = config.fast_set_value
+    config.fast_set_value = True
+    try:
+        driver.element('#name').set_value('Bob')
+    finally:
+        config.fast_set_value = original
+
+    driver.element('#name').should(have.value('Bob'))
+    driver.element('#keys').should(have.exact_text(''))
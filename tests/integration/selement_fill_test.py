@@ -0,0 +1,97 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import pytest
+from selenium.common.exceptions import JavascriptException
+
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_fill_sets_all_kinds_of_fields_and_reports_failures():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <form oninput="document.getElementById('events').textContent += event.target.name + ' '">
+            <input name="email">
+            <input name="agree" type="checkbox">
+            <input name="size" type="radio" value="s" checked><input name="size" type="radio" value="m">
+            <select name="plan"><option value="free">Free</option><option value="pro">Pro</option></select>
+            <select name="tags" multiple><option>a</option><option>b</option><option>c</option></select>
+            <textarea id="note"></textarea>
+            <input name="locked" disabled>
+        </form>
+        <span id="events"></span>
+        ''')
+
+    failures = driver.element('form').fill({
+        'email': 'bob@example.com',
+        'agree': True,
+        'size': 'm',
+        'plan': 'Pro',
+        'tags': ['a', 'c'],
+        '#note': 'Hi',
+        'locked': 'x',
+        'missing': 'y'})
+
+    assert failures == {'locked': 'field is disabled', 'missing': 'field was not found'}
+    driver.element('[name="email"]').should(have.value('bob@example.com'))
+    assert driver.element('[name="agree"]').is_selected()
+    assert driver.element('[name="size"][value="m"]').is_selected()
+    driver.element('[name="plan"]').should(have.value('pro'))
+    assert [option.is_selected() for option in driver.all('[name="tags"] option')] == [True, False, True]
+    driver.element('#note').should(have.value('Hi'))
+    driver.element('#events').should(have.text('email agree size plan tags'))
+
+
+def test_fill_fails_at_once_for_fields_with_errors_filling_others():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <form>
+            <input name="avatar" type="file">
+            <input name="email">
+        </form>
+        ''')
+
+    with pytest.raises(JavascriptException) as error:
+        driver.element('form').fill({'avatar': 'photo.png', 'email': 'bob@example.com'})
+
+    assert 'fields avatar of' in str(error.value)
+    driver.element('[name="email"]').should(have.value('bob@example.com'))
@@ -0,0 +1,149 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import pytest
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
+
+from selene import config
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.elements import SeleneSelect
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+original_timeout = config.timeout
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def setup_function(fn):
+    config.timeout = original_timeout
+
+
+def test_select_by_text_fires_change_event():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <select id="plan" onchange="document.getElementById('events').textContent += this.value + ' '">
+            <option value="free">Free</option>
+            <option value="pro">Pro</option>
+        </select>
+        <span id="events"></span>
+        ''')
+
+    driver.element('#plan').select(text='Pro')
+
+    driver.element('#plan').should(have.value('pro'))
+    driver.element('#events').should(have.text('pro'))
+
+
+def test_select_waits_for_select_rendered_later():
+    GIVEN_PAGE.opened_with_body('<div id="form"></div>')
+    GIVEN_PAGE.execute_script_with_timeout(
+        'document.getElementById("form").innerHTML = '
+        '\'<select id="plan"><option value="free">Free</option><option value="pro">Pro</option></select>\';', 250)
+
+    driver.element('#plan').select(value='pro')
+
+    driver.element('#plan').should(have.value('pro'))
+
+
+def test_select_fails_at_once_for_missing_options():
+    GIVEN_PAGE.opened_with_body('<select id="plan"><option value="free">Free</option></select>')
+    config.timeout = 10
+
+    with pytest.raises(NoSuchElementException) as error:
+        driver.element('#plan').select(value='pro')
+
+    assert 'no options with value: pro' in str(error.value)
+    with pytest.raises(NotImplementedError):
+        driver.element('#plan').select(value=['free', 'pro'])
+
+
+def test_select_of_multiple_options_and_their_snapshots():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <select id="tags" multiple>
+            <option value="a">A</option>
+            <option value="b" selected>B</option>
+            <option value="c">C</option>
+        </select>
+        ''')
+    tags = SeleneSelect(driver.element('#tags'))
+
+    tags.select(value=['a', 'c'])
+
+    assert [(option.value, option.text, option.selected) for option in tags.options()] == \
+        [('a', 'A', True), ('b', 'B', False), ('c', 'C', True)]
+    assert [option.value for option in tags.selected_options()] == ['a', 'c']
+    assert tags.deselect_all().selected_options() == []
+
+
+def test_select_by_value_of_any_type_and_fails_to_deselect_all_of_single_select():
+    GIVEN_PAGE.opened_with_body(
+        '''
+        <select id="year">
+            <option value="2019">2019</option>
+            <option value="2020">2020</option>
+        </select>
+        ''')
+    year = SeleneSelect(driver.element('#year'))
+
+    year.select(value=2020)
+
+    driver.element('#year').should(have.value('2020'))
+    with pytest.raises(NotImplementedError):
+        year.deselect_all()
+
+
+def test_select_requires_either_value_or_text():
+    GIVEN_PAGE.opened_with_body('<select id="plan"><option value="free">Free</option></select>')
+
+    with pytest.raises(ValueError):
+        driver.element('#plan').select()
+    with pytest.raises(ValueError):
+        driver.element('#plan').select(value='free', text='Free')
+
+
+def test_select_fails_for_disabled_options():
+    GIVEN_PAGE.opened_with_body(
+        '<select id="plan"><option value="free">Free</option><option value="pro" disabled>Pro</option></select>')
+    config.timeout = 0.5
+
+    with pytest.raises(TimeoutException) as error:
+        driver.element('#plan').select(text='Pro')
+
+    assert 'options are disabled: Pro' in str(error.value)
+    driver.element('#plan').should(have.value('free'))
@@ -0,0 +1,90 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from selene import config
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+WHEN = GIVEN_PAGE  # type: GivenPage
+original_timeout = config.timeout
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+    global WHEN
+    WHEN = GIVEN_PAGE
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_snapshot_takes_the_same_values_as_webelement():
+    GIVEN_PAGE.opened_with_body('''
+        <form>
+            <input id="first" name="first" value="Bob" style="color: red">
+            <input id="second" name="second" value="Kate" disabled>
+            <label style="display: none">Hidden</label>
+        </form>''')
+    element = driver.element('form').element('#first')
+    webelement = element.get_actual_webelement()
+
+    snapshot = element.snapshot('value', 'name', 'tag_name', 'displayed', 'enabled', 'size', 'css:color')
+
+    assert snapshot.value == webelement.get_attribute('value')
+    assert snapshot.name == 'first'
+    assert snapshot.tag_name == webelement.tag_name
+    assert snapshot.displayed is True
+    assert snapshot.enabled is True
+    assert snapshot.size == webelement.size
+    assert snapshot['css:color'] == webelement.value_of_css_property('color')
+
+
+def test_snapshot_waits_for_element_to_appear():
+    GIVEN_PAGE.opened_empty()
+    WHEN.load_body_with_timeout('''<p id="will-appear">Hello</p>''', 250)
+
+    assert driver.element('#will-appear').snapshot('text').text == 'Hello'
+
+
+def test_snapshots_of_collection():
+    GIVEN_PAGE.opened_with_body('''
+        <ul>
+            <li class="done">Bob</li>
+            <li>Kate</li>
+            <li style="display: none">Joe</li>
+        </ul>''')
+
+    snapshots = driver.all('li').snapshots('text', 'class', 'displayed')
+
+    assert [it.as_dict() for it in snapshots] == [
+        {'text': 'Bob', 'class': 'done', 'displayed': True},
+        {'text': 'Kate', 'class': '', 'displayed': True},
+        {'text': '', 'class': '', 'displayed': False}]
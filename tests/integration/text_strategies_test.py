@@ -0,0 +1,70 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene import config
+from selene.common.none_object import NoneObject
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from tests.acceptance.helpers.helper import get_test_driver
+from tests.integration.helpers.givenpage import GivenPage
+
+driver = NoneObject('driver')  # type: SeleneDriver
+GIVEN_PAGE = NoneObject('GivenPage')  # type: GivenPage
+
+
+def setup_module(m):
+    global driver
+    driver = SeleneDriver.wrap(get_test_driver())
+    global GIVEN_PAGE
+    GIVEN_PAGE = GivenPage(driver)
+
+
+def teardown_module(m):
+    driver.quit()
+
+
+def test_texts_are_taken_by_strategies():
+    GIVEN_PAGE.opened_with_body('''
+        <ul>
+            <li>  first
+                item</li>
+            <li>second <span style="display: none">hidden</span></li>
+        </ul>''')
+    items = driver.all('li')
+
+    assert items.get_texts('normalized') == ['first item', 'second hidden']
+    assert items.get_texts() == ['first item', 'second']
+    assert items.get_texts('renderedInPage') == ['first item', 'second']
+    items.should(have.exact_texts('first item', 'second hidden', strategy='normalized'))
+    items[1].should(have.exact_text('second', strategy='rendered'))
+    assert items[1].get_text('textContent').startswith('second ')
+
+
+def test_condition_strategy_overrides_configured_one():
+    GIVEN_PAGE.opened_with_body('<ul><li>a <span style="display: none">hidden</span></li></ul>')
+    original_strategy = config.text_strategy
+    config.text_strategy = 'textContent'
+    try:
+        driver.all('li').should(have.exact_texts('a', strategy='rendered'))
+        assert driver.all('li').get_texts() == ['a hidden']
+    finally:
+        config.text_strategy = original_strategy
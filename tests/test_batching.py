@@ -0,0 +1,101 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+
+from selene import batching
+from selene.driver import SeleneDriver
+from tests.helpers import FakeWebDriver
+
+
+def actions_of(scripts):
+    return [args[-1] for args in scripts]
+
+
+def test_actions_are_performed_in_page_by_one_script_at_the_end_of_batch():
+    webdriver = FakeWebDriver([3, None])
+    driver = SeleneDriver.wrap(webdriver)
+
+    with batching.batch() as batch:
+        driver.element('#name').set('Bob')
+        driver.element('#email').clear()
+        driver.element('#agree').click()
+        assert webdriver.scripts == []
+
+    assert actions_of(webdriver.scripts) == [[['set', 'Bob'], ['clear', None], ['click', None]]]
+    assert [step.in_page for step in batch.steps] == [True, True, True]
+    assert webdriver.log == []
+
+
+def test_failed_step_and_following_ones_are_performed_as_usual():
+    webdriver = FakeWebDriver([1, 'element is not visible'])
+    driver = SeleneDriver.wrap(webdriver)
+
+    with batching.batch() as batch:
+        driver.element('#name').set('Bob')
+        driver.element('#email').set('bob@example.com')
+        driver.element('#agree').click()
+
+    assert [(step.in_page, step.error) for step in batch.steps] == \
+        [(True, None), (False, 'element is not visible'), (False, None)]
+    assert webdriver.log == [('clear', '#email'), ('send_keys', '#email', 'bob@example.com'), ('click', '#agree')]
+
+
+def test_recorded_actions_are_performed_before_other_commands_of_elements():
+    webdriver = FakeWebDriver([1, None], [1, None])
+    driver = SeleneDriver.wrap(webdriver)
+
+    with batching.batch():
+        driver.element('#name').set('Bob')
+        assert driver.element('#name').is_displayed()
+        assert actions_of(webdriver.scripts) == [[['set', 'Bob']]]
+        driver.element('#agree').click()
+
+    assert actions_of(webdriver.scripts) == [[['set', 'Bob']], [['click', None]]]
+
+
+def test_recorded_actions_are_performed_before_commands_of_driver():
+    webdriver = FakeWebDriver([1, None], 'result')
+    driver = SeleneDriver.wrap(webdriver)
+
+    with batching.batch():
+        driver.element('#name').set('Bob')
+        assert driver.execute_script('return 1') == 'result'
+        assert driver.title == ''
+
+    assert actions_of(webdriver.scripts[:1]) == [[['set', 'Bob']]]
+    assert webdriver.scripts[1:] == [[]]  # the script of the driver, executed after the recorded actions
+    assert webdriver.log == ['title']
+
+
+def test_batch_does_not_record_actions_of_other_threads():
+    webdriver = FakeWebDriver()
+    driver = SeleneDriver.wrap(webdriver)
+
+    with batching.batch() as batch:
+        thread = threading.Thread(target=driver.element('#name').clear)
+        thread.start()
+        thread.join()
+
+    assert batch.steps == []
+    assert webdriver.log == [('clear', '#name')]
@@ -21,7 +21,8 @@
 # SOFTWARE.
 
 from selene.bys import by, by_css, by_name, by_link_text, by_partial_link_text, by_xpath, following_sibling, parent, \
-    first_child, by_text, by_partial_text, escape_text_quotes_for_xpath
+    first_child, by_text, by_partial_text, escape_text_quotes_for_xpath, right_of, near, \
+    by_shadow
 
 
 def test_by_css():
@@ -67,3 +68,20 @@ def test_by_partial_text():
 
 def test_by_escape_text_quotes_for_xpath():
     assert escape_text_quotes_for_xpath('test') == 'concat("", "test")'
+
+
+def test_by_right_of():
+    assert right_of('label.name', 'input') == (
+        'selene relative',
+        '{"anchor": ["css selector", "label.name"], "candidates": ["css selector", "input"], "direction": "right_of"}')
+
+
+def test_by_near():
+    assert near(('id', 'title'), './/p', distance=10) == (
+        'selene relative',
+        '{"anchor": ["css selector", "[id=\\"title\\"]"], "candidates": ["xpath", ".//p"], '
+        '"direction": "near", "distance": 10}')
+
+
+def test_by_shadow():
+    assert by_shadow('my-app >>> input') == ('selene shadow', 'my-app >>> input')
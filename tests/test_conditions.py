@@ -20,6 +20,10 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import pytest
+
+from selene import conditions
+from selene.exceptions import ConditionMismatchException
 from selene.support.conditions import have
 
 
@@ -49,3 +53,37 @@ def test_condition_have_exact_texts():
 
 def test_condition_have_texts():
     assert have.texts("a", "b", "c").expected == ("a", "b", "c")
+
+
+def test_condition_each_reports_all_failed_indexes():
+    class FakeWebElement(object):
+        def __init__(self, css_class):
+            self.css_class = css_class
+
+        def get_attribute(self, name):
+            return self.css_class
+
+    webelements = [FakeWebElement('done'), FakeWebElement('active'), FakeWebElement('active done')]
+
+    assert conditions.each(have.css_class('done')).match([webelements[0], webelements[2]])
+    with pytest.raises(ConditionMismatchException) as ex:
+        conditions.each(have.css_class('active')).match(webelements)
+    assert 'condition did not match for elements at indexes: 0' in str(ex.value)
+    with pytest.raises(ConditionMismatchException) as ex:
+        conditions.each(have.not_(have.css_class("active"))).match(webelements)
+    assert 'condition did not match for elements at indexes: 1, 2' in str(ex.value)
+
+
+def test_condition_visible_and_hidden_match_actual_displayed_state():
+    assert conditions.is_matched_actual(conditions.visible, True)
+    assert not conditions.is_matched_actual(conditions.visible, False)
+    assert conditions.is_matched_actual(conditions.hidden, False)
+    assert not conditions.is_matched_actual(conditions.hidden, True)
+    assert conditions.is_matched_actual(conditions.not_(conditions.visible), False)
+
+
+def test_condition_without_in_page_support_is_not_checked_in_page_even_if_negated():
+    assert conditions.in_page_actual_of(conditions.visible) == conditions.visible.in_page_actual
+    assert conditions.in_page_actual_of(conditions.clickable) is None
+    assert conditions.in_page_actual_of(conditions.not_(conditions.clickable)) is None
+    assert not conditions.is_matched_actual(conditions.not_(conditions.clickable), False)
@@ -0,0 +1,76 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import inspect
+from abc import ABCMeta, abstractmethod, abstractproperty
+
+from future.utils import with_metaclass
+
+from selene.common.delegation import DelegatingMeta
+from selene.driver import SeleneDriver
+from selene.elements import SeleneElement, SeleneCollection
+
+
+class IGreeter(with_metaclass(ABCMeta, object)):
+    @abstractproperty
+    def name(self): pass
+
+    @abstractmethod
+    def greet(self, greeting, *names, punctuation='!'): pass
+
+    @abstractmethod
+    def wave(self, times=1): pass
+
+
+class Greeter(object):
+    name = 'greeter'
+
+    def greet(self, greeting, *names, punctuation='!'):
+        return '{} {}{}'.format(greeting, ', '.join(names), punctuation)
+
+    def wave(self, times=1):
+        return 'wave' * times
+
+
+class DelegatingGreeter(with_metaclass(DelegatingMeta, IGreeter)):
+    def __init__(self, delegate):
+        self.__delegate__ = delegate
+
+
+def test_delegating_meta_generates_delegators_with_signatures_of_abstract_methods():
+    greeter = DelegatingGreeter(Greeter())
+
+    assert greeter.name == 'greeter'
+    assert greeter.greet('Hello', 'Bob', 'Kate', punctuation='.') == 'Hello Bob, Kate.'
+    assert greeter.wave() == 'wave'
+    assert greeter.wave(times=2) == 'wavewave'
+    assert str(inspect.signature(DelegatingGreeter.greet)) == "(self, greeting, *names, punctuation='!')"
+    assert str(inspect.signature(DelegatingGreeter.wave)) == '(self, times=1)'
+
+
+def test_delegating_meta_keeps_class_names():
+    assert DelegatingGreeter.__name__ == 'DelegatingGreeter'
+    assert SeleneElement.__name__ == 'SeleneElement'
+    assert SeleneCollection.__name__ == 'SeleneCollection'
+    assert SeleneDriver.__name__ == 'SeleneDriver'
@@ -0,0 +1,125 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+from selenium.common.exceptions import NoSuchFrameException, TimeoutException
+
+from selene import config
+from selene import frames
+from selene.driver import SeleneDriver
+from tests.helpers import FakeWebDriver
+
+EDITOR = (('css selector', '#editor'),)
+
+
+def switches(webdriver):
+    return [entry[1] for entry in webdriver.log if entry[0] == 'switch_to']
+
+
+@pytest.fixture
+def short_timeout():
+    original = config.timeout
+    config.timeout = 0.2
+    yield
+    config.timeout = original
+
+
+def test_consecutive_lookups_in_the_same_frame_switch_to_it_once():
+    webdriver = FakeWebDriver()
+    frame = SeleneDriver.wrap(webdriver).frame('#editor')
+
+    frame.element('#bold').click()
+    frame.element('#italic').click()
+
+    assert switches(webdriver) == ['#editor']
+
+
+def test_lookup_in_nested_frame_continues_from_its_parent_frame():
+    webdriver = FakeWebDriver()
+    frame = SeleneDriver.wrap(webdriver).frame('#outer')
+
+    frame.element('#a').click()
+    frame.frame('#inner').element('#b').click()
+
+    assert switches(webdriver) == ['#outer', '#inner']
+
+
+def test_top_level_lookup_switches_back_from_frame():
+    webdriver = FakeWebDriver()
+    driver = SeleneDriver.wrap(webdriver)
+
+    driver.frame('#editor').element('#bold').click()
+    driver.element('#save').click()
+    driver.frame('#editor').element('#bold').click()
+
+    assert switches(webdriver) == ['#editor', 'default', '#editor']
+
+
+def test_forgotten_frame_is_switched_to_from_top_level():
+    webdriver = FakeWebDriver()
+    frame = SeleneDriver.wrap(webdriver).frame('#editor')
+
+    frame.element('#bold').click()
+    frames.forget(webdriver)
+    frame.element('#bold').click()
+
+    assert switches(webdriver) == ['#editor', 'default', '#editor']
+
+
+def test_lookup_of_missing_element_in_remembered_frame_does_not_switch_frames_again(short_timeout):
+    webdriver = FakeWebDriver()
+    webdriver.missing = ['#italic']
+    frame = SeleneDriver.wrap(webdriver).frame('#editor')
+
+    frame.element('#bold').click()
+    with pytest.raises(TimeoutException):
+        frame.element('#italic').click()
+
+    assert switches(webdriver) == ['#editor']
+
+
+def test_command_failed_in_remembered_frame_that_is_gone_is_retried_from_top_level():
+    webdriver = FakeWebDriver()
+    frames.switch_to(webdriver, EDITOR)
+    failures = [NoSuchFrameException()]
+
+    def command():
+        if failures:
+            raise failures.pop()
+        return 'done'
+
+    assert frames.within(webdriver, EDITOR, command) == 'done'
+    assert switches(webdriver) == ['#editor', 'default', '#editor']
+
+
+def test_scripts_of_driver_are_executed_in_frame_switched_to_until_it_is_left():
+    webdriver = FakeWebDriver(None, None)
+    driver = SeleneDriver.wrap(webdriver)
+
+    driver.frame('#editor').element('#bold').click()
+    driver.execute_script('return document.title')
+    assert switches(webdriver) == ['#editor']
+
+    frames.leave(driver)
+    driver.execute_script('return document.title')
+    assert switches(webdriver) == ['#editor', 'default']
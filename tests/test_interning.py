@@ -0,0 +1,79 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import gc
+
+import pytest
+
+from selene import config
+from selene.interning import interned, interned_all
+
+
+class FakeDriver(object):
+    pass
+
+
+class FakeWebElement(object):
+    def __init__(self, parent, id_):
+        self.parent = parent
+        self.id = id_
+
+
+@pytest.fixture
+def interning_on():
+    original = config.intern_elements
+    config.intern_elements = True
+    yield
+    config.intern_elements = original
+
+
+def test_interned_returns_the_first_webelement_seen_for_the_id(interning_on):
+    driver, other_driver = FakeDriver(), FakeDriver()
+    first = FakeWebElement(driver, 'a')
+
+    assert interned(first) is first
+    assert interned(FakeWebElement(driver, 'a')) is first
+    assert interned_all([FakeWebElement(driver, 'b'), FakeWebElement(driver, 'a')])[1] is first
+    assert interned(FakeWebElement(other_driver, 'a')) is not first
+
+
+def test_interned_forgets_webelements_not_referenced_anymore(interning_on):
+    driver = FakeDriver()
+    first = FakeWebElement(driver, 'a')
+    interned(first)
+    del first
+    gc.collect()
+
+    second = FakeWebElement(driver, 'a')
+    assert interned(second) is second
+
+
+def test_interned_does_nothing_when_disabled():
+    driver = FakeDriver()
+    first = FakeWebElement(driver, 'a')
+    interned(first)
+
+    second = FakeWebElement(driver, 'a')
+    assert interned(second) is second
+    assert interned('not a webelement') == 'not a webelement'
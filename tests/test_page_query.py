@@ -0,0 +1,93 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from selene import page_query
+from selene.driver import SeleneDriver
+from selene.page_query import PageQuery
+from selene.support.conditions import have
+from tests import helpers
+
+driver = SeleneDriver.wrap(helpers.FakeWebDriver())
+
+
+def test_page_query_of_inner_collection_of_indexed_element():
+    collection = driver.all('.row')[2].all('//td')
+
+    assert str(collection._locator.page_query()) == \
+        "PageQuery(['all', 'css selector', '.row'], ['index', 2], ['all', 'xpath', '//td'])"
+
+
+def test_page_query_of_inner_element_converts_by_like_w3c_selenium():
+    element = driver.element(('id', 'list')).element(('name', 'first'))
+
+    assert str(element._locator.page_query()) == \
+        "PageQuery(['all', 'css selector', '[id=\"list\"]'], ['index', 0], " \
+        "['all', 'css selector', '[name=\"first\"]'], ['index', 0])"
+
+
+def test_page_query_is_absent_for_link_text():
+    assert driver.all(('link text', 'Home'))._locator.page_query() is None
+    assert driver.element(('link text', 'Home')).all('li')._locator.page_query() is None
+
+
+def test_page_query_is_absent_for_filtered_collection():
+    assert driver.all('li').filtered_by(have.css_class('done'))._locator.page_query() is None
+
+
+def test_page_query_of_sliced_collection():
+    assert str(driver.all('li')[-3:]._locator.page_query()) == \
+        "PageQuery(['all', 'css selector', 'li'], ['slice', -3, None, None])"
+    assert str(driver.all('li')[1:10:2][0]._locator.page_query()) == \
+        "PageQuery(['all', 'css selector', 'li'], ['slice', 1, 10, 2], ['index', 0])"
+
+
+def test_page_query_rejects_zero_slice_step():
+    with pytest.raises(ValueError):
+        driver.all('li')[::0]._locator.page_query()
+
+
+def test_library_is_installed_in_the_document_only_when_it_is_missing():
+    webdriver = helpers.FakeWebDriver(page_query._NOT_INSTALLED, None, [True, 2], [True, 3])
+    query = PageQuery.of_document().all(('css selector', 'li'))
+
+    assert query.count(webdriver) == 2
+    assert query.count(webdriver) == 3
+    assert webdriver.scripts[1] == []
+    assert len(webdriver.scripts) == 4
+
+
+def test_asynchronous_script_is_executed_with_own_timeout_restoring_the_session_one():
+    webdriver = helpers.FakeWebDriver([True, 'done'])
+    driver = SeleneDriver.wrap(webdriver)
+    driver.set_script_timeout(5)
+
+    assert PageQuery.of_document().execute_async(driver, 'done("done");', timeout=10) == 'done'
+    assert webdriver.log == [('script_timeout', 5), ('script_timeout', 11), ('script_timeout', 5)]
+
+
+def test_indexed_element_is_found_with_size_of_collection_by_one_script():
+    webdriver = helpers.FakeWebDriver([True, [1, 'a']], [True, [2, 'b']])
+
+    assert SeleneDriver.wrap(webdriver).all('li')[1].get_actual_webelement() == 'b'
+    assert len(webdriver.scripts) == 2
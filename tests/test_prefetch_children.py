@@ -0,0 +1,49 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+from selene.driver import SeleneDriver
+from tests.helpers import FakeWebDriver, FakeWebElement
+
+
+def test_prefetch_children_binds_elements_found_by_one_script():
+    log = []
+    webdriver = FakeWebDriver([True, [[FakeWebElement(log, 'apple'), FakeWebElement(log, '1')],
+                                      [FakeWebElement(log, 'pear'), FakeWebElement(log, '2')]]])
+    driver = SeleneDriver.wrap(webdriver)
+
+    rows = driver.all('.item').prefetch_children({'name': '.name', 'qty': './/*[@class="qty"]'})
+
+    assert [(row['name'].text, row['qty'].text) for row in rows] == [('apple', '1'), ('pear', '2')]
+    assert len(webdriver.scripts) == 1
+    assert str(rows[1]['qty']) == "all_by('css selector', '.item')[1].find_by('xpath', './/*[@class=\"qty\"]')"
+
+
+def test_element_not_found_in_advance_is_found_lazily():
+    webdriver = FakeWebDriver([True, [[None]]], [True, [1, FakeWebElement([], 'row')]])
+    driver = SeleneDriver.wrap(webdriver)
+
+    row = driver.all('.item').prefetch_children({'qty': '.qty'})[0]
+
+    assert row['qty'].text == 'row .qty'
+    assert len(webdriver.scripts) == 2
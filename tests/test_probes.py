@@ -0,0 +1,47 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import time
+
+from selene.conditions import not_
+from selene.driver import SeleneDriver
+from selene.support.conditions import be
+from tests.helpers import FakeWebDriver
+
+
+def test_probes_do_not_wait_for_absent_elements():
+    webdriver = FakeWebDriver(*[[False]] * 3)
+    webdriver.missing = ['.parent', 'Parent']
+    driver = SeleneDriver.wrap(webdriver)
+    started = time.time()
+
+    assert not driver.element('.parent').element('.child').exists_now()
+    assert not driver.element(('link text', 'Parent')).element('.child').exists_now()
+    assert driver.element('.parent').all('.child').count_now() == 0
+    assert driver.element(('link text', 'Parent')).all('.child').count_now() == 0
+    assert driver.element('.parent').matches_now(not_(be.in_dom))
+
+    assert time.time() - started < 1
+    assert webdriver.results == []
+    assert webdriver.finds == 4
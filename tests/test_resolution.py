@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from selene.driver import SeleneDriver
+from selene.resolution import resolution_scope, within
+
+
+class FakeParent(object):
+    def __init__(self, *webelements):
+        self.webelements = list(webelements)
+        self.resolved = 0
+
+    def resolve(self):
+        self.resolved += 1
+        return self.webelements.pop(0)
+
+
+def find_child(webelement):
+    if webelement == 'stale':
+        raise StaleElementReferenceException()
+    return webelement + ' child'
+
+
+def test_within_resolves_parent_each_time_out_of_scope():
+    parent = FakeParent('first', 'second')
+
+    assert within(parent, parent.resolve, find_child) == 'first child'
+    assert within(parent, parent.resolve, find_child) == 'second child'
+    assert parent.resolved == 2
+
+
+def test_within_resolves_parent_once_per_scope():
+    parent = FakeParent('first', 'second')
+
+    with resolution_scope():
+        assert within(parent, parent.resolve, find_child) == 'first child'
+        with resolution_scope():
+            assert within(parent, parent.resolve, find_child) == 'first child'
+    assert within(parent, parent.resolve, find_child) == 'second child'
+    assert parent.resolved == 2
+
+
+def test_within_resolves_parent_again_when_stale_in_scope():
+    parent = FakeParent('stale', 'fresh')
+
+    with resolution_scope():
+        try:
+            within(parent, parent.resolve, find_child)
+        except StaleElementReferenceException:
+            pass
+        assert within(parent, parent.resolve, find_child) == 'fresh child'
+        assert within(parent, parent.resolve, find_child) == 'fresh child'
+    assert parent.resolved == 2
+
+
+def test_within_shares_parents_built_separately_by_the_same_locator():
+    class ResolvingWebDriver(WebDriver):
+        def __init__(self):
+            pass
+
+    driver = SeleneDriver.wrap(ResolvingWebDriver())
+    parent = FakeParent('first', 'second')
+
+    with resolution_scope():
+        assert within(driver.element('#a'), parent.resolve, find_child) == 'first child'
+        assert within(driver.element('#a'), parent.resolve, find_child) == 'first child'
+        assert within(driver.element('#b'), parent.resolve, find_child) == 'second child'
+    assert parent.resolved == 2
@@ -0,0 +1,47 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene import config
+from selene.driver import SeleneDriver
+from tests.helpers import FakeWebDriver
+
+
+def scroll_step(rows, moved=True, end=False):
+    return [True, {'rows': [[row, [row]] for row in rows], 'moved': moved, 'end': end}]
+
+
+def test_scroll_stream_yields_rendered_rows_once_until_container_stops_scrolling():
+    webdriver = FakeWebDriver(
+        scroll_step(['1', '2', '3']), scroll_step(['3', '4']), scroll_step(['4', '5']), scroll_step(['4', '5'], False))
+
+    rows = SeleneDriver.wrap(webdriver).all('.row').scroll_stream('.grid', key='data-id', fields=['data-id'])
+
+    assert [row['data-id'] for row in rows] == ['1', '2', '3', '4', '5']
+    assert [args[3] for args in webdriver.scripts] == [False, True, True, True]
+
+
+def test_scroll_stream_waits_for_each_step_with_session_script_timeout_of_config_timeout():
+    webdriver = FakeWebDriver(scroll_step([], moved=False))
+
+    list(SeleneDriver.wrap(webdriver).all('.row').scroll_stream('.grid'))
+
+    assert webdriver.log == [('script_timeout', config.timeout + 1), ('script_timeout', 30)]
@@ -0,0 +1,62 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from selene.snapshot import Snapshot, as_numpy_records
+
+
+def test_snapshot_values_are_accessible_by_fields():
+    snapshot = Snapshot(('text', 'css:color', 'data-id'), ['Bob', 'rgba(0, 0, 0, 1)', '7'])
+
+    assert snapshot.text == 'Bob'
+    assert snapshot['css:color'] == 'rgba(0, 0, 0, 1)'
+    assert snapshot['data-id'] == '7'
+    assert snapshot.as_dict() == {'text': 'Bob', 'css:color': 'rgba(0, 0, 0, 1)', 'data-id': '7'}
+
+
+def test_snapshot_is_immutable():
+    snapshot = Snapshot(('text',), ['Bob'])
+
+    with pytest.raises(AttributeError):
+        snapshot.text = 'Kate'
+    with pytest.raises(AttributeError):
+        snapshot.value
+    with pytest.raises(KeyError):
+        snapshot['value']
+    assert not hasattr(snapshot, '__dict__')
+
+
+def test_snapshots_are_equal_by_values():
+    assert Snapshot(('text',), ['Bob']) == Snapshot(('text',), ['Bob'])
+    assert Snapshot(('text',), ['Bob']) != Snapshot(('text',), ['Kate'])
+
+
+def test_extracted_columns_as_numpy_records():
+    pytest.importorskip('numpy')
+
+    records = as_numpy_records(['id', 'name'], [['1', '2'], ['apple', None]])
+
+    assert list(records.id) == ['1', '2']
+    assert list(records['name']) == ['apple', None]
+    assert records[0].name == 'apple'
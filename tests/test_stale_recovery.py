@@ -0,0 +1,72 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from selene import config
+from selene.driver import SeleneDriver
+from tests.helpers import FakeWebDriver
+
+
+@pytest.fixture
+def slow_polling():
+    original = config.poll_during_waits
+    config.poll_during_waits = 1
+    yield
+    config.poll_during_waits = original
+
+
+def test_stale_element_is_found_again_without_waiting(slow_polling):
+    webdriver = FakeWebDriver()
+    webdriver.stale = 2
+    started = time.time()
+
+    SeleneDriver.wrap(webdriver).element('#button').click()
+
+    assert webdriver.log == [('click', '#button')]
+    assert webdriver.finds == 3
+    assert time.time() - started < 0.5
+
+
+def test_stale_element_is_found_again_limited_number_of_times(slow_polling):
+    webdriver = FakeWebDriver()
+    webdriver.stale = config.stale_element_retries + 1
+
+    with pytest.raises(StaleElementReferenceException):
+        SeleneDriver.wrap(webdriver).element('#button').click()
+    assert webdriver.finds == config.stale_element_retries + 1
+
+
+def test_cached_element_is_found_again_when_stale(slow_polling):
+    webdriver = FakeWebDriver()
+    webdriver.stale = 1
+    element = SeleneDriver.wrap(webdriver).element('#button').cached()
+
+    element.click()
+
+    assert webdriver.log == [('click', '#button')]
+    assert webdriver.finds == 2
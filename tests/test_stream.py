@@ -0,0 +1,50 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+import pytest
+
+from selene.driver import SeleneDriver
+from tests.helpers import FakeWebDriver
+
+
+def test_stream_finds_elements_by_chunks_lazily():
+    webdriver = FakeWebDriver([True, ['a', 'b']], [True, ['c', 'd']], [True, ['e']])
+    elements = SeleneDriver.wrap(webdriver).all('li').stream(chunk_size=2)
+
+    assert next(elements).get_actual_webelement() == 'a'
+    assert len(webdriver.scripts) == 1
+    assert [element.get_actual_webelement() for element in elements] == ['b', 'c', 'd', 'e']
+    assert len(webdriver.scripts) == 3
+
+
+def test_stream_describes_elements_by_their_index_in_collection():
+    webdriver = FakeWebDriver([True, ['a', 'b']], [True, ['c']])
+    elements = list(SeleneDriver.wrap(webdriver).all('li').stream(chunk_size=2))
+
+    assert str(elements[2]) == "${this}[${index}]".format(this="all_by('css selector', 'li')", index=2)
+
+
+def test_stream_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        SeleneDriver.wrap(FakeWebDriver()).all('li').stream(chunk_size=0)
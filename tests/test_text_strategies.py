@@ -0,0 +1,73 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import pytest
+
+from selene import config
+from selene.driver import SeleneDriver
+from selene.support.conditions import have
+from selene.text_strategies import TextStrategy
+from tests.helpers import FakeWebDriver
+
+
+@pytest.fixture
+def text_content_strategy():
+    original = config.text_strategy
+    config.text_strategy = TextStrategy.TEXT_CONTENT
+    yield
+    config.text_strategy = original
+
+
+def test_rendered_texts_are_taken_by_webelements():
+    webdriver = FakeWebDriver()
+    driver = SeleneDriver.wrap(webdriver)
+
+    assert driver.element('h1').text == 'h1'
+    driver.all('li').should(have.exact_texts('li'))
+    driver.all('li').should_each(have.exact_text('li'))
+    assert webdriver.scripts == []
+
+
+def test_collection_texts_are_matched_by_one_script(text_content_strategy):
+    webdriver = FakeWebDriver([True, ['apple', 'banana']])
+
+    SeleneDriver.wrap(webdriver).all('li').should(have.exact_texts('apple', 'banana'))
+
+    assert len(webdriver.scripts) == 1
+    assert webdriver.log == []
+
+
+def test_element_text_is_taken_by_configured_strategy(text_content_strategy):
+    webdriver = FakeWebDriver([True, 'apple'], [True, 'apple'])
+    element = SeleneDriver.wrap(webdriver).element('li')
+
+    assert element.text == 'apple'
+    assert element.get_text(TextStrategy.RENDERED) == 'li'
+    assert len(webdriver.scripts) == 1
+    assert element.get_text(TextStrategy.INNER_TEXT) == 'apple'
+    assert len(webdriver.scripts) == 2
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        have.text('apple', strategy='outerHTML')